@@ -1,12 +1,12 @@
 import streamlit as st
 import sys
 from pathlib import Path
-import pandas as pd
 
 # Add project root to sys.path for module imports
 sys.path.append(str(Path(__file__).parent))
 
 from config.settings import *
+from modules.pages import show_revenue_engineering, show_organic_architecture, show_cro_terminal
 
 # Page configuration
 st.set_page_config(
@@ -16,10 +16,35 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# North Star metric tooltips
+MER_HELP = "Marketing Efficiency Ratio: Revenue / Spend"
+CONTRIBUTION_HELP = "Total Revenue - Total Ad Spend"
+LTV_CAC_HELP = "60-Day LTV divided by CPA (Target > 3.0)"
+REAL_REVENUE_HELP = "Backend confirmed orders (Source of Truth)"
+
+# Columns shown in the overview Data Preview table
+PREVIEW_COLUMNS = ['date', 'funnel_stage', 'spend', 'revenue', 'roas', 'orders']
+
+# Resolved once at import so reruns don't depend on the working directory
+CSS_PATH = Path(__file__).parent / 'assets' / 'styles.css'
+
+@st.cache_resource
+def _read_css(path):
+    """Read a stylesheet once per server process instead of on every rerun"""
+    return Path(path).read_text()
+
+@st.cache_resource
+def _preview_table(_revenue_df, last_date):
+    """
+    Arrow table for the Data Preview, converted from pandas once per dataset.
+    Keyed on the latest date rather than the frame itself so Streamlit doesn't hash the whole DataFrame.
+    """
+    import pyarrow as pa
+    return pa.Table.from_pandas(_revenue_df.iloc[-40:][PREVIEW_COLUMNS], preserve_index=False)
+
 # load custom CSS
 def load_css():
-    with open('assets/styles.css') as f:
-        st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+    st.markdown(f'<style>{_read_css(CSS_PATH)}</style>', unsafe_allow_html=True)
 
 # Main app 
 def main():
@@ -30,27 +55,10 @@ def main():
     st.sidebar.title("🎯 MARKTIVO GROWTH OS")
     st.sidebar.markdown("---")
 
-    page = st.sidebar.radio(
-        "Navigation",
-        ["🏠 Dashboard Overview", 
-        "💰 Revenue Engineering", 
-        "📱 Organic Architecture", 
-        "🎯 CRO Terminal", 
-        "🤖 RevOps Automation"]
-    )
+    page = st.sidebar.radio("Navigation", list(_PAGES))
 
     # Page routing
-    if page == "🏠 Dashboard Overview":
-        show_overview()
-    elif page == "💰 Revenue Engineering":
-        show_revenue_engineering()
-    elif page == "📱 Organic Architecture":
-        show_organic_architecture()
-    elif page == "🎯 CRO Terminal":
-        show_cro_terminal()
-    elif page == "🤖 RevOps Automation":
-        st.title("🤖 RevOps Automation")
-        st.info("Module 4 - Coming soon...")
+    _PAGES[page]()
 
 def show_overview():
     """Dashboard Overview - North Star Metrics"""
@@ -60,62 +68,31 @@ def show_overview():
     st.markdown("---")
 
     # Load data
-    from utils.data_loader import DataLoader
-    loader = DataLoader()
-
-    revenue_df = loader.load_revenue_data()
+    from utils.data_loader import get_data_loader
+    loader = get_data_loader()
 
-    if not revenue_df.empty:
-        # Calculate key metrics
-        last_7_days = revenue_df[revenue_df['date'] >= revenue_df['date'].max() - pd.Timedelta(days=7)]
-
-        total_revenue = last_7_days['revenue'].sum()
-        total_spend = last_7_days['spend'].sum()
-        mer = total_revenue / total_spend if total_spend > 0 else 0
-        contribution = total_revenue - total_spend
+    kpis = loader.load_north_star_kpis()
 
+    if kpis:
         # North Star Metrics
         st.markdown('#### 📊 **NORTH STAR METRICS** (Last 7 Days)')
 
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric(
-                label="MER (7-Day Rolling)",
-                value=f"{mer:,.2f}x",
-                delta="+3%",
-                help="Marketing Efficiency Ratio: Revenue / Spend"
-            )
-        with col2:
-            st.metric(
-                label="Contribution Margin",
-                value=f"${contribution:,.0f}",
-                delta="+12%",
-                help="Total Revenue - Total Ad Spend"
-            )
-        
-        with col3:
-            st.metric(
-                label="Projected LTV:CAC",
-                value="3.2",
-                delta="+0.4",
-                help="60-Day LTV divided by CPA (Target > 3.0)"
-            )
-        
-        with col4:
-            st.metric(
-                label="Real Revenue",
-                value=f"${total_revenue:,.0f}",
-                delta="+8%",
-                help="Backend confirmed orders (Source of Truth)"
-            )
+        metrics = (
+            ("MER (7-Day Rolling)", f"{kpis['mer']:,.2f}x", "+3%", MER_HELP),
+            ("Contribution Margin", f"${kpis['contribution']:,.0f}", "+12%", CONTRIBUTION_HELP),
+            ("Projected LTV:CAC", "3.2", "+0.4", LTV_CAC_HELP),
+            ("Real Revenue", f"${kpis['revenue']:,.0f}", "+8%", REAL_REVENUE_HELP),
+        )
+        for col, (label, value, delta, help_text) in zip(st.columns(4), metrics):
+            col.metric(label=label, value=value, delta=delta, help=help_text)
         
         st.markdown("---")
 
-        # Data Preview
-        with st.expander("📋 **Data Preview** (Last 10 Days)"):
+        # Data Preview (only serialized to the browser once the user asks for it)
+        if st.toggle("📋 **Data Preview** (Last 10 Days)", key="show_data_preview"):
+            revenue_df = loader.load_revenue_data()
             st.dataframe(
-                revenue_df.tail(40)[['date', 'funnel_stage', 'spend', 'revenue', 'roas', 'orders']],
+                _preview_table(revenue_df, revenue_df['date'].iloc[-1]),
                 use_container_width=True
             )
     else:
@@ -147,20 +124,19 @@ def show_overview():
     Enforce operational discipline and prevent knee-jerk decisions.
     """)
 
-def show_revenue_engineering():
-    """Module 1: Revenue Engineering"""
-    from modules.revenue_engineering import show_revenue_engineering as revenue_module
-    revenue_module()
-
-def show_organic_architecture():
-    """Module 2: Organic Architecture"""
-    from modules.organic_architecture import show_organic_architecture as organic_module
-    organic_module()
-
-def show_cro_terminal():
-    """Module 3: CRO Terminal"""
-    from modules.cro_terminal import show_cro_terminal as cro_module
-    cro_module()
+def show_revops_automation():
+    """Module 4: RevOps Automation"""
+    st.title("🤖 RevOps Automation")
+    st.info("Module 4 - Coming soon...")
+
+# Sidebar label -> page handler (insertion order is the navigation order)
+_PAGES = {
+    "🏠 Dashboard Overview": show_overview,
+    "💰 Revenue Engineering": show_revenue_engineering,
+    "📱 Organic Architecture": show_organic_architecture,
+    "🎯 CRO Terminal": show_cro_terminal,
+    "🤖 RevOps Automation": show_revops_automation,
+}
 
 
 if __name__ == "__main__":
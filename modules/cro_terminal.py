@@ -10,12 +10,12 @@ CSS: assets/module3_cro.css (to be created)
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
-import random
+from functools import lru_cache
+from pathlib import Path
 
-from utils.data_loader import DataLoader
+# Plotly and the DataLoader are imported inside the functions that use them,
+# so importing this module (e.g. for format_number or the theme constants) stays cheap.
 
 # ============================================================
 # 1. THEME CONSTANTS
@@ -62,31 +62,264 @@ SOURCE_COLORS = {
 }
 
 
+CSS_PATH = Path(__file__).parent.parent / 'assets' / 'module3_cro.css'
+
+@st.cache_resource
+def _read_css(path):
+    """Read a stylesheet once per server process instead of on every rerun."""
+    return Path(path).read_text()
+
 def load_module3_css():
     """Load Module 3 CSS from external file in assets/ folder."""
-    import os
-    css_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'module3_cro.css')
     try:
-        with open(css_path) as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        css = _read_css(CSS_PATH)
     except FileNotFoundError:
-        try:
-            with open('assets/module3_cro.css') as f:
-                st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-        except FileNotFoundError:
-            st.warning("⚠️ CSS file not found: assets/module3_cro.css")
+        st.warning("⚠️ CSS file not found: assets/module3_cro.css")
+        return
+    st.markdown(f'<style>{css}</style>', unsafe_allow_html=True)
+
+# Upper bound on points per trend-chart trace; longer histories are thinned before plotting
+TREND_MAX_POINTS = 1000
 
+# (divisor, suffix) indexed by how many thresholds (1K, 1M) a number clears
+_NUMBER_SCALES = ((1, ""), (1_000, "K"), (1_000_000, "M"))
+
+@lru_cache(maxsize=4096, typed=True)
 def format_number(num):
     """Format large numbers: 1500 → 1.5K, 1500000 → 1.5M"""
-    if num >= 1_000_000:
-        return f"{num / 1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num / 1_000:.1f}K"
-    return str(int(num))
+    idx = int(num >= 1_000) + int(num >= 1_000_000)
+    if not idx:
+        return str(int(num))
+    divisor, suffix = _NUMBER_SCALES[idx]
+    return f"{num / divisor:.1f}{suffix}"
+
+def _status_color(value, good, warn=None, higher_is_better=True):
+    """
+    Benchmark color for a metric: green when it clears `good`, yellow when it only clears `warn`
+    (if given), red otherwise. Lower-is-better metrics clear a threshold by staying under it.
+    """
+    if higher_is_better:
+        if value >= good:
+            return NEON_GREEN
+        return NEON_YELLOW if warn is not None and value >= warn else NEON_RED
+    if value < good:
+        return NEON_GREEN
+    return NEON_YELLOW if warn is not None and value < warn else NEON_RED
 
 # ============================================================
 # 2. COMPONENT
 # ============================================================
+# Bouncer total name -> traffic_df column it sums
+_BOT_TOTAL_COLUMNS = {
+    "total_bots": "bot_sessions",
+    "total_raw": "total_sessions",
+    "total_human": "human_sessions",
+    "total_sub_1s": "bot_sub_1s",
+    "total_known_ips": "bot_known_ips",
+    "total_no_js": "bot_no_js",
+}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _bot_totals(traffic_df):
+    """Session and bot totals for the Bouncer panel, cached so widget reruns skip the column scans"""
+    # One 2-D reduction over all six columns instead of six separate Series.sum() passes
+    sums = traffic_df[list(_BOT_TOTAL_COLUMNS.values())].to_numpy().sum(axis=0)
+    return dict(zip(_BOT_TOTAL_COLUMNS, sums.tolist()))
+
+# funnel_df columns shared by the Bouncer KPIs, Red Alert funnel, Metric Stack and AI Brain
+_FUNNEL_SUM_COLUMNS = ["landing_page", "product_page", "add_to_cart", "checkout", "purchase", "human_sessions"]
+_FUNNEL_MEAN_COLUMNS = ["true_cvr", "bounce_rate", "cart_abandonment"]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _funnel_totals(funnel_df):
+    """
+    Period totals (stage counts, human sessions) and average daily rates keyed by funnel_df column.
+    Every CRO section reads these instead of re-reducing the same columns.
+    """
+    sums = funnel_df[_FUNNEL_SUM_COLUMNS].to_numpy(dtype=np.int64).sum(axis=0)
+    means = funnel_df[_FUNNEL_MEAN_COLUMNS].to_numpy().mean(axis=0)
+    return {**dict(zip(_FUNNEL_SUM_COLUMNS, sums.tolist())), **dict(zip(_FUNNEL_MEAN_COLUMNS, means.tolist()))}
+
+# ============================================================
+# HTML TEMPLATES (filled with str.format inside the render loops)
+# ============================================================
+_STAT_CARD_TPL = (
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {color}; border-radius: 12px; padding: 16px; text-align: center;">'
+    '<div style="font-size: 13px; color: #8892A0; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px;">{label}</div>'
+    '<div style="font-size: 25px; font-weight: 700; color: {color}; margin-bottom: 4px;">{value}</div>'
+    '<div style="font-size: 11px; color: #5A6577;">{sub}</div>'
+    '</div>'
+)
+
+_DEVICE_CARD_TPL = (
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {color}; border-radius: 12px; padding: 16px;">'
+    '<div style="font-size: 13px; font-weight: 600; color: #FFFFFF; margin-bottom: 4px;">{icon} {device}</div>'
+    '<div style="font-size: 10px; color: #5A6577; margin-bottom: 12px;">{share:.0f}% of traffic · {sessions} sessions</div>'
+    '<div style="display: flex; justify-content: space-between; margin-bottom: 8px;">'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">CVR</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: {cvr_color};">{cvr:.2f}%</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Bounce</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: {bounce_color};">{bounce:.1f}%</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Cart Abn.</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: ' + NEON_YELLOW + ';">{cart_abandon:.1f}%</div>'
+    '</div>'
+    '</div>'
+    '<div style="font-size: 10px; color: #5A6577; border-top: 1px solid #2D3348; padding-top: 8px; margin-top: 4px;">'
+    'Orders: <span style="color: #FFFFFF; font-weight: 600;">{orders}</span>'
+    '</div>'
+    '</div>'
+)
+
+_SOURCE_CARD_TPL = (
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {color}; border-radius: 12px; padding: 16px;">'
+    '<div style="font-size: 12px; font-weight: 600; color: #FFFFFF; margin-bottom: 4px;">{source}</div>'
+    '<div style="font-size: 10px; color: #5A6577; margin-bottom: 12px;">{share:.0f}% of traffic · {sessions} sessions</div>'
+    '<div style="display: flex; justify-content: space-between;">'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">CVR</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: {cvr_color};">{cvr:.2f}%</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Cart Abn.</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: ' + NEON_YELLOW + ';">{cart_abandon:.1f}%</div>'
+    '</div>'
+    '<div>'
+    '<div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Orders</div>'
+    '<div style="font-size: 20px; font-weight: 700; color: #FFFFFF;">{orders}</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+
+# Table row backgrounds, indexed by row parity (even, odd)
+_ZEBRA_BGS = ("#181C27", "#1B1F2B")
+
+_CARD_GRID_TPL = '<div style="display: grid; grid-template-columns: repeat({n_cols}, 1fr); gap: 16px;">{cards}</div>'
+
+_MATRIX_HEADER_TPL = (
+    '<div style="display: grid; grid-template-columns: 1.2fr repeat({n_cols}, 1fr); gap: 2px; margin-bottom: 2px;">'
+    '<div style="background: #222838; padding: 8px 10px; border-radius: 4px 0 0 0; font-size: 9px; color: #5A6577; text-transform: uppercase;">Metric</div>'
+    '{cells}'
+    '</div>'
+)
+
+_MATRIX_HEADER_CELL_TPL = '<div style="background: #222838; padding: 8px 10px; text-align: center; font-size: 9px; color: {color}; font-weight: 600; text-transform: uppercase;">{label}</div>'
+
+_MATRIX_CELL_TPL = '<div style="background: #1B1F2B; padding: 8px 10px; text-align: center; font-size: 11px; color: {color}; font-weight: {weight};">{text}</div>'
+
+_MATRIX_ROW_TPL = (
+    '<div style="display: grid; grid-template-columns: 1.2fr repeat({n_cols}, 1fr); gap: 2px; margin-bottom: 2px;">'
+    '<div style="background: {bg}; padding: 8px 10px; font-size: 10px; color: #8892A0;">{label}</div>'
+    '{cells}'
+    '</div>'
+)
+
+# Metric Stack card: header + gauge above the sparkline, footer below it (laid out per row in _CARD_GRID_TPL)
+_METRIC_CARD_HEAD_TPL = (
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-radius: 12px 12px 0 0; padding: 16px 20px;">'
+    '<div style="display: flex; justify-content: space-between; align-items: flex-start;">'
+    '<div>'
+    '<div style="font-size: 10px; color: #8892A0; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px;">{name}</div>'
+    '<div style="font-size: 32px; font-weight: 700; color: {color};">{value}</div>'
+    '</div>'
+    '<div style="text-align: right;">'
+    '<div style="padding: 3px 10px; border-radius: 20px; background: {status_bg}; font-size: 8px; font-weight: 700; color: {status_color}; text-transform: uppercase; letter-spacing: 0.8px; margin-bottom: 6px;">{status_text}</div>'
+    '<div style="font-size: 13px; font-weight: 600; color: {delta_color};">{delta_arrow} {delta_fmt}</div>'
+    '<div style="font-size: 8px; color: #5A6577;">vs prev 7 days</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border-left: 1px solid #2D3348; border-right: 1px solid #2D3348; padding: 0 20px 12px 20px;">'
+    '<div style="display: flex; justify-content: space-between; font-size: 9px; color: #5A6577; margin-bottom: 4px;">'
+    '<span>0</span>'
+    '<span>Target: {benchmark}</span>'
+    '<span>{gauge_max}</span>'
+    '</div>'
+    '<div style="position: relative; width: 100%; height: 8px; background: #2D3348; border-radius: 8px; overflow: hidden;">'
+    '<div style="height: 100%; width: {gauge_pct:.0f}%; background: linear-gradient(90deg, {color}, {color}88); border-radius: 8px;"></div>'
+    '</div>'
+    '<div style="font-size: 9px; color: #8892A0; margin-top: 6px;">{calculation}</div>'
+    '</div>'
+)
+
+_METRIC_CARD_FOOTER_TPL = (
+    '<div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: none; border-radius: 0 0 12px 12px; padding: 10px 20px;">'
+    '<div style="font-size: 10px; color: #8892A0; font-style: italic;">💡 {why}</div>'
+    '</div>'
+)
+
+_METRIC_ROW_SPACER_HTML = "<div style='height: 8px;'></div>"
+
+_METRIC_TABLE_HEADER_HTML = (
+    '<div style="display: grid; grid-template-columns: 1.2fr 2fr 0.8fr 2fr; gap: 2px; margin-bottom: 2px;">'
+    '<div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600; border-radius: 4px 0 0 0;">Metric</div>'
+    '<div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600;">Calculation</div>'
+    '<div style="background: #222838; padding: 10px 12px; text-align: center; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600;">Benchmark</div>'
+    '<div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600; border-radius: 0 4px 0 0;">Why It Matters</div>'
+    '</div>'
+)
+
+_METRIC_TABLE_ROW_TPL = (
+    '<div style="display: grid; grid-template-columns: 1.2fr 2fr 0.8fr 2fr; gap: 2px; margin-bottom: 2px;">'
+    '<div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: {color}; font-weight: 600;">{name}</div>'
+    '<div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: #FFFFFF;">{calculation}</div>'
+    '<div style="background: {bg}; padding: 10px 12px; text-align: center; font-size: 11px; color: #FFFFFF;">{benchmark}</div>'
+    '<div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: #FFFFFF;">{why}</div>'
+    '</div>'
+)
+
+# AI Brain insight card: header, analysis body and recommendation footer in one block
+_INSIGHT_CARD_TPL = (
+    '<div style="background: {bg}; border: 1px solid {border}; border-radius: 12px 12px 0 0; padding: 14px 20px;">'
+    '<div style="display: flex; align-items: center; justify-content: space-between;">'
+    '<div style="display: flex; align-items: center; gap: 10px;">'
+    '<span style="font-size: 22px;">{icon}</span>'
+    '<div>'
+    '<div style="font-size: 20px; font-weight: 600; color: #FFFFFF;">{title}</div>'
+    '<div style="font-size: 15px; color: #5A6577; margin-top: 2px;">Logic {logic_id}: {logic_name}</div>'
+    '</div>'
+    '</div>'
+    '<div style="padding: 3px 10px; border-radius: 20px; background: {label_bg}; font-size: 9px; font-weight: 700; color: {label_color}; text-transform: uppercase; letter-spacing: 1px;">{label}</div>'
+    '</div>'
+    '</div>'
+    '<div style="background: {bg}; border-left: 1px solid {border}; border-right: 1px solid {border}; padding: 0 20px 12px 20px;">'
+    '<div style="font-size: 15px; color: #C0C7D0; line-height: 1.7; padding: 10px 14px; background: rgba(0,0,0,0.15); border-radius: 8px;">'
+    '<span style="font-size: 9px; color: #5A6577; text-transform: uppercase; letter-spacing: 1px; display: block; margin-bottom: 6px;">📊 Analysis</span>'
+    '{body}'
+    '</div>'
+    '</div>'
+    '<div style="background: {bg}; border: 1px solid {border}; border-top: none; border-radius: 0 0 12px 12px; padding: 0 20px 14px 20px;">'
+    '<div style="font-size: 15px; color: #C0C7D0; line-height: 1.7; padding: 10px 14px; background: rgba(0,0,0,0.1); border-radius: 8px; border-left: 3px solid {accent};">'
+    '<span style="font-size: 9px; color: {accent}; text-transform: uppercase; letter-spacing: 1px; display: block; margin-bottom: 6px;">💡 Recommendation</span>'
+    '{recommendation}'
+    '</div>'
+    '</div>'
+    "<div style='height: 12px;'></div>"
+)
+
+@st.fragment
+def render_bouncer_section(traffic_df, funnel_df, speed_df):
+    """
+    Traffic View filter + Bouncer stats as a fragment: switching the filter
+    reruns only this section, not the funnel, matrix and metric charts below.
+    """
+    col_f1, col_f2 = st.columns([2,8])
+    with col_f1:
+        traffic_view = st.selectbox(
+            "👁️ Traffic View",
+            ["True Human Traffic", "All Traffic (inc. Bots)"],
+            index=0,
+            key="cro_traffic_view"
+        )
+
+    is_filtered = traffic_view == "True Human Traffic"
+    render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df)
+
 def render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df):
     """
     Section 1: Data Integrity Layer — "The Bouncer"
@@ -94,17 +327,19 @@ def render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df):
     """
     st.markdown('<div class="section-header">🛡️ DATA INTEGRITY — THE BOUNCER</div>', unsafe_allow_html=True)
 
-    total_bots = traffic_df["bot_sessions"].sum()
-    total_raw = traffic_df["total_sessions"].sum()
-    total_human = traffic_df["human_sessions"].sum()
-    total_sub_1s = traffic_df["bot_sub_1s"].sum()
-    total_known_ips = traffic_df["bot_known_ips"].sum()
-    total_no_js = traffic_df["bot_no_js"].sum()
+    totals = _bot_totals(traffic_df)
+    total_bots = totals["total_bots"]
+    total_raw = totals["total_raw"]
+    total_human = totals["total_human"]
+    total_sub_1s = totals["total_sub_1s"]
+    total_known_ips = totals["total_known_ips"]
+    total_no_js = totals["total_no_js"]
     bot_pct = total_bots / max(total_raw, 1) * 100
 
-    avg_cvr = funnel_df["true_cvr"].mean()
-    avg_bounce = funnel_df["bounce_rate"].mean()
-    avg_cart_abandon = funnel_df["cart_abandonment"].mean()
+    funnel_totals = _funnel_totals(funnel_df)
+    avg_cvr = funnel_totals["true_cvr"]
+    avg_bounce = funnel_totals["bounce_rate"]
+    avg_cart_abandon = funnel_totals["cart_abandonment"]
     avg_lcp_mobile = speed_df["lcp_mobile"].mean()
 
     # Toogle status indicator
@@ -119,7 +354,6 @@ def render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df):
     """, unsafe_allow_html=True)
 
     # KPI row - Key Metrics
-    kpi_cols = st.columns(5)
     kpi_items = [
         {
             "label": "True Sessions" if is_filtered else "Raw Sessions",
@@ -131,36 +365,32 @@ def render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df):
             "label": "True CVR",
             "value": f"{avg_cvr:.2f}%",
             "sub": f"Benchmark: >2.5%",
-            "color": NEON_GREEN if avg_cvr >= 2.5 else NEON_RED,
+            "color": _status_color(avg_cvr, 2.5),
         },
         {
             "label": "Bounce Rate",
             "value": f"{avg_bounce:.1f}%",
             "sub": f"Benchmark: <40%",
-            "color": NEON_GREEN if avg_bounce < 40 else NEON_RED,
+            "color": _status_color(avg_bounce, 40, higher_is_better=False),
         },
         {
             "label": "Cart Abandonment",
             "value": f"{avg_cart_abandon:.1f}%",
             "sub": f"Benchmark: <70%",
-            "color": NEON_GREEN if avg_cart_abandon < 70 else NEON_RED,
+            "color": _status_color(avg_cart_abandon, 70, higher_is_better=False),
         },
         {
             "label": "Avg LCP (Mobile)",
             "value": f"{avg_lcp_mobile:.1f}s",
             "sub": f"Benchmark: <2.5s",
-            "color": NEON_GREEN if avg_lcp_mobile < 2.5 else (NEON_YELLOW if avg_lcp_mobile < 4.0 else NEON_RED),
+            "color": _status_color(avg_lcp_mobile, 2.5, 4.0, higher_is_better=False),
         },
     ]
 
-    for idx, kpi in enumerate(kpi_items):
-        with kpi_cols[idx]:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {kpi['color']}; border-radius: 12px; padding: 16px; text-align: center;">
-                <div style="font-size: 13px; color: #8892A0; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px;">{kpi['label']}</div>
-                <div style="font-size: 25px; font-weight: 700; color: {kpi['color']}; margin-bottom: 4px;">{kpi['value']}</div>
-                <div style="font-size: 11px; color: #5A6577;">{kpi['sub']}</div>
-            </div>""", unsafe_allow_html=True)
+    # All five KPI cards as one HTML grid
+    st.markdown(_CARD_GRID_TPL.format(
+        n_cols=len(kpi_items), cards="".join(_STAT_CARD_TPL.format_map(kpi) for kpi in kpi_items),
+    ), unsafe_allow_html=True)
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -175,12 +405,155 @@ def render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df):
 
     for idx, item in enumerate(bot_items):
         with bot_cols[idx]:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {item['color']}; border-radius: 12px; padding: 16px; text-align: center;">
-                <div style="font-size: 13px; color: #8892A0; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px;">{item['icon']} {item['label']}</div>
-                <div style="font-size: 25px; font-weight: 700; color: {item['color']}; margin-bottom: 4px;">{item['value']}</div>
-                <div style="font-size: 11px; color: #5A6577;">{item['sub']}</div>
-            </div>""", unsafe_allow_html=True)
+            st.markdown(_STAT_CARD_TPL.format(
+                color=item["color"],
+                label=f"{item['icon']} {item['label']}",
+                value=item["value"],
+                sub=item["sub"],
+            ), unsafe_allow_html=True)
+
+# (health, color, label) indexed by how many benchmark thresholds (bad, good) a step clears
+_FUNNEL_HEALTH = (
+    ("bad", NEON_RED, "CRITICAL"),
+    ("warning", NEON_YELLOW, "WARNING"),
+    ("good", NEON_GREEN, "HEALTHY"),
+)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _sorted_funnel(funnel_df):
+    """Funnel rows in date order for the trend charts, sorted once per dataset rather than on every rerun"""
+    return funnel_df.sort_values("date").reset_index(drop=True)
+
+def _thin_rows(df, max_points):
+    """
+    Evenly spaced subset of at most `max_points` rows (first and last always kept).
+    Long date ranges then send a bounded number of points per trace to the browser.
+    """
+    if len(df) <= max_points:
+        return df
+    return df.iloc[np.linspace(0, len(df) - 1, max_points).round().astype(int)]
+
+# Daily trend series: funnel_df column, legend name, line color, area fill (line color at 5% opacity)
+_TREND_STAGES = [
+    {"col": "landing_page", "name": "Landing Page", "color": NEON_BLUE, "fillcolor": "rgba(0, 212, 255, 0.05)"},
+    {"col": "product_page", "name": "Product Page", "color": NEON_PURPLE, "fillcolor": "rgba(168, 85, 247, 0.05)"},
+    {"col": "add_to_cart", "name": "Add to Cart", "color": NEON_ORANGE, "fillcolor": "rgba(255, 107, 53, 0.05)"},
+    {"col": "checkout", "name": "Checkout", "color": NEON_YELLOW, "fillcolor": "rgba(255, 215, 0, 0.05)"},
+    {"col": "purchase", "name": "Purchase", "color": NEON_GREEN, "fillcolor": "rgba(0, 255, 136, 0.05)"},
+]
+
+# Figure builders: cached on the aggregated values they plot, so reruns with unchanged data reuse the built figure
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _funnel_fig(labels, values, colors):
+    """Red Alert stage funnel"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Funnel(
+        y=list(labels),
+        x=values,
+        textposition="auto",
+        textinfo="value+percent initial",
+        texttemplate="%{value:,.0f}<br><b>%{percentInitial:.1%}</b>",
+        textfont=dict(color="#000000", size=15),
+        marker=dict(
+            color=list(colors),
+            line=dict(width=1, color="#2D3348"),
+        ),
+        connector=dict(
+            line=dict(color="#2D3348", width=1),
+            fillcolor="rgba(45, 51, 72, 0.2)",
+        ),
+    ))
+
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=TEXT_SECONDARY, size=12),
+        height=380,
+        margin=dict(l=10, r=10, t=10, b=10),
+        showlegend=False,
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _funnel_trend_fig(dates, counts):
+    """Daily funnel trend; `counts` has one row per entry of _TREND_STAGES"""
+    import plotly.graph_objects as go
+
+    # Build every trace up front and hand them to the constructor in one go (WebGL instead of SVG)
+    traces = [
+        go.Scattergl(
+            x=dates,
+            y=stage_counts,
+            mode="lines",
+            name=stage["name"],
+            line=dict(color=stage["color"], width=2),
+            fill="tozeroy",
+            fillcolor=stage["fillcolor"],
+            hovertemplate=f"<b>{stage['name']}</b><br>Date: %{{x|%b %d}}<br>Count: %{{y:,.0f}}<extra></extra>",
+        )
+        for stage, stage_counts in zip(_TREND_STAGES, counts)
+    ]
+
+    return go.Figure(data=traces, layout=dict(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=TEXT_SECONDARY, size=11),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=1.02,
+            xanchor="center", x=0.5,
+            font=dict(color=TEXT_PRIMARY, size=10),
+        ),
+        xaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat="%b %d"),
+        yaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat=","),
+        height=300,
+        margin=dict(l=10, r=10, t=40, b=10),
+        hovermode="x unified",
+    ))
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cvr_trend_fig(dates, cvr):
+    """True CVR over time with the 2.5% target line"""
+    import plotly.graph_objects as go
+
+    fig3 = go.Figure()
+
+    fig3.add_trace(go.Scattergl(
+        x=dates,
+        y=cvr,
+        mode="lines+markers",
+        name="True CVR",
+        line=dict(color=NEON_GREEN, width=2.5),
+        marker=dict(size=4, color=NEON_GREEN),
+        fill="tozeroy",
+        fillcolor="rgba(0, 255, 136, 0.06)",
+        hovertemplate="Date: %{x|%b %d}<br>CVR: %{y:.2f}%<extra></extra>",
+    ))
+
+    # Benchmark line
+    fig3.add_hline(
+        y=2.5,
+        line_dash="dash",
+        line_color=NEON_YELLOW,
+        line_width=1.5,
+        annotation_text="Target: 2.5%",
+        annotation_position="top right",
+        annotation_font=dict(color=NEON_YELLOW, size=9),
+    )
+
+    fig3.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=TEXT_SECONDARY, size=11),
+        xaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat="%b %d"),
+        yaxis=dict(gridcolor="#1E2330", showgrid=True, title="CVR (%)", titlefont=dict(color=TEXT_MUTED, size=10)),
+        height=250,
+        margin=dict(l=10, r=10, t=10, b=10),
+        showlegend=False,
+    )
+    return fig3
 
 def render_red_alert_funnel(funnel_df):
     """
@@ -190,18 +563,14 @@ def render_red_alert_funnel(funnel_df):
     st.markdown('<div class="section-header">🚨 RED ALERT FUNNEL — IDENTIFY LEAKY BUCKETS</div>', unsafe_allow_html=True)
 
     # Aggregate funnel data
-    total_landing = funnel_df["landing_page"].sum()
-    total_product = funnel_df["product_page"].sum()
-    total_cart = funnel_df["add_to_cart"].sum()
-    total_checkout = funnel_df["checkout"].sum()
-    total_purchase = funnel_df["purchase"].sum()
+    totals = _funnel_totals(funnel_df)
 
     stages= [
-        {"name": "Landing Page", "value": total_landing, "icon": "🏠"},
-        {"name": "Product Page", "value": total_product, "icon": "📦"},
-        {"name": "Add to Cart", "value": total_cart, "icon": "🛒"},
-        {"name": "Initiate Checkout", "value": total_checkout, "icon": "💳"},
-        {"name": "Purchase", "value": total_purchase, "icon": "✅"},
+        {"name": "Landing Page", "value": totals["landing_page"], "icon": "🏠"},
+        {"name": "Product Page", "value": totals["product_page"], "icon": "📦"},
+        {"name": "Add to Cart", "value": totals["add_to_cart"], "icon": "🛒"},
+        {"name": "Initiate Checkout", "value": totals["checkout"], "icon": "💳"},
+        {"name": "Purchase", "value": totals["purchase"], "icon": "✅"},
     ]
 
     # Calculate drop-off rates between stages
@@ -212,36 +581,29 @@ def render_red_alert_funnel(funnel_df):
         "Add to Cart → Initiate Checkout": {"good": 55, "bad": 40},
         "Initiate Checkout → Purchase": {"good": 50, "bad": 35},
     }
+    # Pass-through / drop-off rates and dropped counts for every step at once
+    stage_values = np.array([s["value"] for s in stages])
+    pass_rates = stage_values[1:] / np.maximum(stage_values[:-1], 1) * 100
+    drop_rates = 100 - pass_rates
+    dropped = stage_values[:-1] - stage_values[1:]
+
+    # Health level per step: count of (bad, good) thresholds cleared -> 0=critical, 1=warning, 2=healthy
+    step_benchmarks = [
+        benchmarks.get(f"{from_stage['name']} → {to_stage['name']}", {"good": 50, "bad": 35})
+        for from_stage, to_stage in zip(stages, stages[1:])
+    ]
+    thresholds = np.array([[bm["bad"], bm["good"]] for bm in step_benchmarks])
+    health_levels = (pass_rates[:, None] >= thresholds).sum(axis=1)
+
     transitions = []
-    for i in range(len(stages) - 1):
-        from_stage = stages[i]
-        to_stage = stages[i + 1]
-        pass_rate = to_stage["value"] / max(from_stage["value"], 1) * 100
-        drop_rate = 100 - pass_rate
-        dropped = from_stage["value"] - to_stage["value"]
-
-        bm_key = f"{from_stage['name']} → {to_stage['name']}"
-        bm = benchmarks.get(bm_key, {"good": 50, "bad": 35})
-
-        if pass_rate >= bm["good"]:
-            health = "good"
-            health_color = NEON_GREEN
-            health_label = "HEALTHY"
-        elif pass_rate >= bm["warning"]:
-            health = "warning"
-            health_color = NEON_YELLOW
-            health_label = "WARNING"
-        else:
-            health = "bad"
-            health_color = NEON_RED
-            health_label = "CRITICAL"
-    
+    for i, level in enumerate(health_levels):
+        health, health_color, health_label = _FUNNEL_HEALTH[level]
         transitions.append({
-            "from": from_stage["name"],
-            "to": to_stage["name"],
-            "pass_rate": pass_rate,
-            "drop_rate": drop_rate,
-            "dropped": dropped,
+            "from": stages[i]["name"],
+            "to": stages[i + 1]["name"],
+            "pass_rate": pass_rates[i],
+            "drop_rate": drop_rates[i],
+            "dropped": dropped[i],
             "health": health,
             "health_color": health_color,
             "health_label": health_label,
@@ -255,34 +617,11 @@ def render_red_alert_funnel(funnel_df):
         for t in transitions:
             stage_colors.append(t["health_color"])
 
-        fig = go.Figure()
-
-        fig.add_trace(go.Funnel(
-            y=[f"{s['icon']} {s['name']}" for s in stages],
-            x=[s["value"] for s in stages],
-            textposition="auto",
-            textinfo="value+percent initial",
-            texttemplate="%{value:,.0f}<br><b>%{percentInitial:.1%}</b>",
-            textfont=dict(color="#000000", size=15),
-            marker=dict(
-                color=stage_colors,
-                line=dict(width=1, color="#2D3348"),
-            ),
-            connector=dict(
-                line=dict(color="#2D3348", width=1),
-                fillcolor="rgba(45, 51, 72, 0.2)",
-            ),
-        ))
-
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color=TEXT_SECONDARY, size=12),
-            height=380,
-            margin=dict(l=10, r=10, t=10, b=10),
-            showlegend=False,
+        fig = _funnel_fig(
+            tuple(f"{s['icon']} {s['name']}" for s in stages),
+            stage_values,
+            tuple(stage_colors),
         )
-
         st.plotly_chart(fig, use_container_width=True)
     
     with col_detail:
@@ -315,87 +654,16 @@ def render_red_alert_funnel(funnel_df):
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 12px;">📈 Daily Conversion Funnel Trend</div>""", unsafe_allow_html=True)
 
-    fig2 = go.Figure()
-
-    trend_stages = [
-        {"col": "landing_page", "name": "Landing Page", "color": NEON_BLUE},
-        {"col": "product_page", "name": "Product Page", "color": NEON_PURPLE},
-        {"col": "add_to_cart", "name": "Add to Cart", "color": NEON_ORANGE},
-        {"col": "checkout", "name": "Checkout", "color": NEON_YELLOW},
-        {"col": "purchase", "name": "Purchase", "color": NEON_GREEN},
-    ]
-
-    sorted_df = funnel_df.sort_values("date")
-
-    for stage in trend_stages:
-        fig2.add_trace(go.Scatter(
-            x=sorted_df["date"],
-            y=sorted_df[stage["col"]],
-            mode="lines",
-            name=stage["name"],
-            line=dict(color=stage["color"], width=2),
-            fill="tozeroy",
-            fillcolor=f"rgba({int(stage['color'][1:3], 16)}, {int(stage['color'][3:5], 16)}, {int(stage['color'][5:7], 16)}, 0.05)",
-            hovertemplate=f"<b>{stage['name']}</b><br>Date: %{{x|%b %d}}<br>Count: %{{y:,.0f}}<extra></extra>",
-        ))
-
-    fig2.update_layout(
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=TEXT_SECONDARY, size=11),
-        legend=dict(
-            orientation="h", yanchor="bottom", y=1.02,
-            xanchor="center", x=0.5,
-            font=dict(color=TEXT_PRIMARY, size=10),
-        ),
-        xaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat="%b %d"),
-        yaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat=","),
-        height=300,
-        margin=dict(l=10, r=10, t=40, b=10),
-        hovermode="x unified",
-    )
+    sorted_df = _thin_rows(_sorted_funnel(funnel_df), TREND_MAX_POINTS)
+    dates = sorted_df["date"].to_numpy()
 
+    fig2 = _funnel_trend_fig(dates, sorted_df[[stage["col"] for stage in _TREND_STAGES]].to_numpy().T)
     st.plotly_chart(fig2, use_container_width=True)
 
     # --- CVR Over Time ---
     st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 12px;">🎯 True CVR Over Time</div>""", unsafe_allow_html=True)
 
-    fig3 = go.Figure()
-
-    fig3.add_trace(go.Scatter(
-        x=sorted_df["date"],
-        y=sorted_df["true_cvr"],
-        mode="lines+markers",
-        name="True CVR",
-        line=dict(color=NEON_GREEN, width=2.5),
-        marker=dict(size=4, color=NEON_GREEN),
-        fill="tozeroy",
-        fillcolor="rgba(0, 255, 136, 0.06)",
-        hovertemplate="Date: %{x|%b %d}<br>CVR: %{y:.2f}%<extra></extra>",
-    ))
-
-    # Benchmark line
-    fig3.add_hline(
-        y=2.5,
-        line_dash="dash",
-        line_color=NEON_YELLOW,
-        line_width=1.5,
-        annotation_text="Target: 2.5%",
-        annotation_position="top right",
-        annotation_font=dict(color=NEON_YELLOW, size=9),
-    )
-
-    fig3.update_layout(
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=TEXT_SECONDARY, size=11),
-        xaxis=dict(gridcolor="#1E2330", showgrid=True, tickformat="%b %d"),
-        yaxis=dict(gridcolor="#1E2330", showgrid=True, title="CVR (%)", titlefont=dict(color=TEXT_MUTED, size=10)),
-        height=250,
-        margin=dict(l=10, r=10, t=10, b=10),
-        showlegend=False,
-    )
-
+    fig3 = _cvr_trend_fig(dates, sorted_df["true_cvr"].to_numpy())
     st.plotly_chart(fig3, use_container_width=True)
 
 def render_metrix_split(device_df, source_df):
@@ -421,73 +689,176 @@ def render_metrix_split(device_df, source_df):
     with tab_source:
         _render_source_split(source_df)
 
+# Funnel count column -> key used by the Device/Source split renderers
+_SPLIT_SUM_COLUMNS = {
+    "sessions": "sessions",
+    "landing_page": "landing",
+    "product_page": "product",
+    "add_to_cart": "cart",
+    "checkout": "checkout",
+    "purchase": "purchase",
+}
+
+# Step pass-through rate -> (numerator, denominator) aggregate columns
+_SPLIT_PASS_THROUGH = {
+    "landing_to_product": ("product", "landing"),
+    "product_to_cart": ("cart", "product"),
+    "cart_to_checkout": ("checkout", "cart"),
+    "checkout_to_purchase": ("purchase", "checkout"),
+}
+
+def _split_aggregates(df, key, colors):
+    """
+    Funnel totals and averages per `key` group for the Device/Source tabs, from a single groupby.
+    Returns one dict per group, in order of first appearance.
+    """
+    grouped = df.groupby(key, sort=False, observed=True)
+    mean_cols = {"cart_abandonment": "cart_abandon"}
+    if "bounce_rate" in df.columns:
+        mean_cols["bounce_rate"] = "bounce"
+
+    # One reducer per call: a single sum over all count columns, a single mean over the rate columns
+    agg = grouped[list(_SPLIT_SUM_COLUMNS)].sum().rename(columns=_SPLIT_SUM_COLUMNS)
+    agg = agg.join(grouped[list(mean_cols)].mean().rename(columns=mean_cols))
+    agg["cvr"] = agg["purchase"] / agg["sessions"].clip(lower=1) * 100
+    for name, (num, den) in _SPLIT_PASS_THROUGH.items():
+        agg[name] = agg[num] / agg[den].clip(lower=1) * 100
+    agg["color"] = [colors.get(group, "#444") for group in agg.index]
+    return agg.reset_index().to_dict("records")
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _device_funnel_fig(devices, colors, step_pcts):
+    """Grouped funnel bars per device; `step_pcts` has one row per device (landing → purchase, % of landing)"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    step_labels = ["Landing", "Product", "Cart", "Checkout", "Purchase"]
+
+    for device, color, vals in zip(devices, colors, step_pcts):
+        fig.add_trace(go.Bar(
+            name=device,
+            x=step_labels,
+            y=vals,
+            marker=dict(color=color, coloraxis="coloraxis4"),
+            text=[f"{v:.1f}%" for v in vals],
+            textposition="auto",
+            textfont=dict(color=TEXT_PRIMARY, size=10),
+        ))
+
+    fig.update_layout(
+        barmode="group",
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=TEXT_SECONDARY, size=11),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=1.02,
+            xanchor="center", x=0.5,
+            font=dict(color=TEXT_PRIMARY, size=10),
+        ),
+        xaxis=dict(gridcolor="rgba(0,0,0,0)", showgrid=False),
+        yaxis=dict(gridcolor="#1E2330", showgrid=True, title="% of Landing", titlefont=dict(size=10, color=TEXT_MUTED)),
+        height=365,
+        margin=dict(l=10, r=10, t=40, b=10),
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _source_cvr_fig(sources, colors, cvrs):
+    """Horizontal CVR bars per source (already sorted ascending) with the 2.5% target line"""
+    import plotly.graph_objects as go
+
+    fig_cvr = go.Figure()
+
+    fig_cvr.add_trace(go.Bar(
+        x=cvrs,
+        y=list(sources),
+        orientation="h",
+        marker=dict(
+            color=list(colors),
+            coloraxis="coloraxis4",
+        ),
+        text=[f"{cvr:.2f}%" for cvr in cvrs],
+        textposition="auto",
+        textfont=dict(color=TEXT_PRIMARY, size=10),
+    ))
+
+    fig_cvr.add_vline(
+        x=2.5, line_dash="dash", line_color=NEON_YELLOW, line_width=1.5,
+        annotation_text="Target: 2.5%",
+        annotation_position="top",
+        annotation_font=dict(color=NEON_YELLOW, size=9),
+    )
+
+    fig_cvr.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=TEXT_SECONDARY, size=10),
+        xaxis=dict(gridcolor="#1E2330", showgrid=True, zeroline=False),
+        yaxis=dict(gridcolor="rgba(0,0,0,0)", showgrid=False),
+        height=30 * len(sources) + 200,
+        margin=dict(l=10, r=20, t=10, b=10),
+        showlegend=False,
+    )
+    return fig_cvr
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _device_cards_html(cards):
+    """
+    All device summary cards as one HTML grid, cached on the aggregated numbers.
+    `cards` holds (device, color, sessions, purchase, cvr, bounce, cart_abandon) per device.
+    """
+    total_sessions = max(sum(card[2] for card in cards), 1)
+    html = []
+    for device, color, sessions, purchase, cvr, bounce, cart_abandon in cards:
+        html.append(_DEVICE_CARD_TPL.format(
+            color=color,
+            icon="📱" if device == "Mobile" else ("🖥️" if device == "Desktop" else "📟"),
+            device=device,
+            share=sessions / total_sessions * 100,
+            sessions=format_number(sessions),
+            cvr_color=_status_color(cvr, 2.5, 1.5),
+            cvr=cvr,
+            bounce_color=_status_color(bounce, 40, 50, higher_is_better=False),
+            bounce=bounce,
+            cart_abandon=cart_abandon,
+            orders=format_number(purchase),
+        ))
+    return _CARD_GRID_TPL.format(n_cols=len(cards), cards="".join(html))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _source_cards_html(cards, total_sessions):
+    """
+    Top source summary cards as one 4-column HTML grid, cached on the aggregated numbers.
+    `cards` holds (source, color, sessions, purchase, cvr, cart_abandon); shares are of `total_sessions`.
+    """
+    total_sessions = max(total_sessions, 1)
+    html = []
+    for source, color, sessions, purchase, cvr, cart_abandon in cards:
+        html.append(_SOURCE_CARD_TPL.format(
+            color=color,
+            source=source,
+            share=sessions / total_sessions * 100,
+            sessions=format_number(sessions),
+            cvr_color=_status_color(cvr, 2.5, 1.5),
+            cvr=cvr,
+            cart_abandon=cart_abandon,
+            orders=format_number(purchase),
+        ))
+    return _CARD_GRID_TPL.format(n_cols=4, cards="".join(html))
+
 def _render_device_split(device_df):
     """Render Device breakdown: summary cards + funnel comparison + table."""
 
-    devices = device_df['device'].unique()
-
     # Aggregate per device
-    device_agg = []
-    for device in devices:
-        ddf = device_df[device_df['device'] == device]
-        sessions = ddf['sessions'].sum()
-        purchases = ddf['purchase'].sum()
-        cvr = purchases / max(sessions, 1) * 100
-        bounce = ddf['bounce_rate'].mean()
-        cart_ab = ddf['cart_abandonment'].mean()
-
-        # Funnel total
-        landing = ddf['landing_page'].sum()
-        product = ddf['product_page'].sum()
-        cart = ddf['add_to_cart'].sum()
-        checkout = ddf['checkout'].sum()
-
-        device_agg.append({
-            "device": device,
-            "sessions": sessions,
-            "landing": landing,
-            "product": product,
-            "cart": cart,
-            "checkout": checkout,
-            "purchase": purchases,
-            "cvr": cvr,
-            "bounce": bounce,
-            "cart_abandon": cart_ab,
-            "color": DEVICE_COLORS.get(device, "#444")
-        })
+    device_agg = _split_aggregates(device_df, "device", DEVICE_COLORS)
     
-    # Render summary cards
-    dev_cols = st.columns(len(device_agg))
-    for idx, d in enumerate(device_agg):
-        cvr_color = NEON_GREEN if d["cvr"] >= 2.5 else (NEON_YELLOW if d["cvr"] >= 1.5 else NEON_RED)
-        bounce_color = NEON_GREEN if d["bounce"] < 40 else (NEON_YELLOW if d["bounce"] < 50 else NEON_RED)
-        traffic_share = d["sessions"] / max(sum(x["sessions"] for x in device_agg), 1) * 100
-
-        with dev_cols[idx]:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {d['color']}; border-radius: 12px; padding: 16px;">
-                <div style="font-size: 13px; font-weight: 600; color: #FFFFFF; margin-bottom: 4px;">{"📱" if d["device"] == "Mobile" else ("🖥️" if d["device"] == "Desktop" else "📟")} {d['device']}</div>
-                    <div style="font-size: 10px; color: #5A6577; margin-bottom: 12px;">{traffic_share:.0f}% of traffic · {format_number(d['sessions'])} sessions</div>
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 8px;">
-                <div>
-                <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">CVR</div>
-                    <div style="font-size: 20px; font-weight: 700; color: {cvr_color};">{d['cvr']:.2f}%</div>
-                </div>
-                <div>
-                    <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Bounce</div>
-                    <div style="font-size: 20px; font-weight: 700; color: {bounce_color};">{d['bounce']:.1f}%</div>
-                </div>
-                <div>
-                    <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Cart Abn.</div>
-                    <div style="font-size: 20px; font-weight: 700; color: {NEON_YELLOW};">{d['cart_abandon']:.1f}%</div>
-                </div>
-                </div>
-                    <div style="font-size: 10px; color: #5A6577; border-top: 1px solid #2D3348; padding-top: 8px; margin-top: 4px;">
-                    Orders: <span style="color: #FFFFFF; font-weight: 600;">{format_number(d['purchase'])}</span>
-                </div>
-            </div>""", unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
+    # Render summary cards (one cached HTML grid for all devices)
+    st.markdown(_device_cards_html(tuple(
+        (d["device"], d["color"], d["sessions"], d["purchase"], d["cvr"], d["bounce"], d["cart_abandon"])
+        for d in device_agg
+    )), unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
 
         # --- Funnel Comparison Chart (Grouped Bar) ---
     col_chart, col_table = st.columns([3, 2])
@@ -495,84 +866,52 @@ def _render_device_split(device_df):
     with col_chart:
         st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 10px;">📊 Funnel Comparison by Device</div>""", unsafe_allow_html=True)
 
-        fig = go.Figure()
+        # Each device's funnel as a percentage of its landing sessions
         funnel_steps = ["landing", "product", "cart", "checkout", "purchase"]
-        step_labels = ["Landing", "Product", "Cart", "Checkout", "Purchase"]
-
-        for d in device_agg:
-            # Normalize to percentage of landing page
-            landing_val = max(d["landing"], 1)
-            vals = [d[s] / landing_val * 100 for s in funnel_steps]
-
-            fig.add_trace(go.Bar(
-                name=d["device"],
-                x=step_labels,
-                y=vals,
-                marker=dict(color=d["color"], coloraxis="coloraxis4"),
-                text=[f"{v:.1f}%" for v in vals],
-                textposition="auto",
-                textfont=dict(color=TEXT_PRIMARY, size=10),
-            ))
-
-        fig.update_layout(
-            barmode="group",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color=TEXT_SECONDARY, size=11),
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02,
-                xanchor="center", x=0.5,
-                font=dict(color=TEXT_PRIMARY, size=10),
-            ),
-            xaxis=dict(gridcolor="rgba(0,0,0,0)", showgrid=False),
-            yaxis=dict(gridcolor="#1E2330", showgrid=True, title="% of Landing", titlefont=dict(size=10, color=TEXT_MUTED)),
-            height=365,
-            margin=dict(l=10, r=10, t=40, b=10),
-        )
+        step_pcts = np.array([[d[s] for s in funnel_steps] for d in device_agg], dtype=float)
+        step_pcts = step_pcts / np.maximum(step_pcts[:, :1], 1) * 100
 
+        fig = _device_funnel_fig(
+            tuple(d["device"] for d in device_agg),
+            tuple(d["color"] for d in device_agg),
+            step_pcts,
+        )
         st.plotly_chart(fig, use_container_width=True)
     
     with col_table:
         # --- Comparative Data Table ---
         st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 10px;">📋 Device Performance Matrix</div>""", unsafe_allow_html=True)
         
-        # Table header
-        st.markdown(f"""
-        <div style="display: grid; grid-template-columns: 1.2fr repeat({len(device_agg)}, 1fr); gap: 2px; margin-bottom: 2px;">
-            <div style="background: #222838; padding: 8px 10px; border-radius: 4px 0 0 0; font-size: 9px; color: #5A6577; text-transform: uppercase;">Metric</div>
-            {"".join(f'<div style="background: #222838; padding: 8px 10px; text-align: center; font-size: 9px; color: {d["color"]}; font-weight: 600; text-transform: uppercase;">{d["device"]}</div>' for d in device_agg)}
-        </div>
-        """, unsafe_allow_html=True)
+        # Table header (the header and every row are collected and sent as one markdown element)
+        parts = [_MATRIX_HEADER_TPL.format(
+            n_cols=len(device_agg),
+            cells="".join(_MATRIX_HEADER_CELL_TPL.format(color=d["color"], label=d["device"]) for d in device_agg),
+        )]
 
         # Table rows
         table_rows = [
             {"label": "Sessions", "key": "sessions", "fmt": "num"},
             {"label": "CVR", "key": "cvr", "fmt": "pct2"},
-            {"label": "Bounce Rate", "key": "bounce", "fmt": "pct1"},
-            {"label": "Cart Abandon.", "key": "cart_abandon", "fmt": "pct1"},
-            {"label": "Landing → Product", "key": None, "calc": lambda d: d["product"] / max(d["landing"], 1) * 100, "fmt": "pct1"},
-            {"label": "Product → Cart", "key": None, "calc": lambda d: d["cart"] / max(d["product"], 1) * 100, "fmt": "pct1"},
-            {"label": "Cart → Checkout", "key": None, "calc": lambda d: d["checkout"] / max(d["cart"], 1) * 100, "fmt": "pct1"},
-            {"label": "Checkout → Purchase", "key": None, "calc": lambda d: d["purchase"] / max(d["checkout"], 1) * 100, "fmt": "pct1"},
+            {"label": "Bounce Rate", "key": "bounce", "fmt": "pct1", "best": "min"},
+            {"label": "Cart Abandon.", "key": "cart_abandon", "fmt": "pct1", "best": "min"},
+            {"label": "Landing → Product", "key": "landing_to_product", "fmt": "pct1"},
+            {"label": "Product → Cart", "key": "product_to_cart", "fmt": "pct1"},
+            {"label": "Cart → Checkout", "key": "cart_to_checkout", "fmt": "pct1"},
+            {"label": "Checkout → Purchase", "key": "checkout_to_purchase", "fmt": "pct1"},
             {"label": "Orders", "key": "purchase", "fmt": "num"},
         ]
 
-        for row_idx, row in enumerate(table_rows):
-            cells = []
-            values = []
-            for d in device_agg:
-                if row["key"]:
-                    val = d[row["key"]]
-                else:
-                    val = row["calc"](d)
-                values.append(val)
-            
-            # Find best/worst for conditional formatting
-            best_idx = values.index(max(values)) if row["fmt"] != "pct1" or row["label"] in ["Landing → Product", "Product → Cart", "Cart → Checkout", "Checkout → Purchase"] else values.index(min(values))
-            # For bounce & cart abandon, lower is better
-            if row["label"] in ["Bounce Rate", "Cart Abandon."]:
-                best_idx = values.index(min(values))
+        # Whole matrix at once (rows x devices), then the best cell per row in one argmax/argmin
+        values_matrix = np.array(
+            [[d[row["key"]] for d in device_agg] for row in table_rows],
+            dtype=float,
+        )
+        # Higher is better except for rows marked "min" (bounce, cart abandonment)
+        lower_is_better = np.array([row.get("best") == "min" for row in table_rows])
+        best_per_row = np.where(lower_is_better, values_matrix.argmin(axis=1), values_matrix.argmax(axis=1))
 
+        for row_idx, (row, values, best_idx) in enumerate(zip(table_rows, values_matrix, best_per_row)):
+            cells = []
             for v_idx, val in enumerate(values):
                 if row["fmt"] == "num":
                     text = format_number(val)
@@ -584,78 +923,27 @@ def _render_device_split(device_df):
                 is_best = v_idx == best_idx
                 val_color = NEON_GREEN if is_best else TEXT_PRIMARY
 
-                cells.append(f'<div style="background: #1B1F2B; padding: 8px 10px; text-align: center; font-size: 11px; color: {val_color}; font-weight: {"600" if is_best else "400"};">{text}</div>')
+                cells.append(_MATRIX_CELL_TPL.format(color=val_color, weight="600" if is_best else "400", text=text))
 
-            bg = "#181C27" if row_idx % 2 == 0 else "#1B1F2B"
-            st.markdown(f"""
-            <div style="display: grid; grid-template-columns: 1.2fr repeat({len(device_agg)}, 1fr); gap: 2px; margin-bottom: 2px;">
-                <div style="background: {bg}; padding: 8px 10px; font-size: 10px; color: #8892A0;">{row['label']}</div>
-                {"".join(cells)}
-            </div>""", unsafe_allow_html=True)
+            bg = _ZEBRA_BGS[row_idx & 1]
+            parts.append(_MATRIX_ROW_TPL.format(n_cols=len(device_agg), bg=bg, label=row["label"], cells="".join(cells)))
+
+        st.markdown(f'<div>{"".join(parts)}</div>', unsafe_allow_html=True)
 
 def _render_source_split(source_df):
     """Render Source breakdown: summary cards + funnel comparison + table."""
 
-    sources = source_df['source'].unique().tolist()
-    
     # Aggreagate per source
-    source_agg = []
-    for source in sources:
-        sdf = source_df[source_df["source"] == source]
-        sessions = sdf["sessions"].sum()
-        purchases = sdf["purchase"].sum()
-        cvr = purchases/max(sessions, 1) * 100
-        cart_ab = sdf["cart_abandonment"].mean()
-
-        landing = sdf["landing_page"].sum()
-        product = sdf["product_page"].sum()
-        cart = sdf["add_to_cart"].sum()
-        checkout = sdf["checkout"].sum()
-
-        source_agg.append({
-            "source": source,
-            "sessions": sessions,
-            "landing": landing,
-            "product": product,
-            "cart": cart,
-            "checkout": checkout,
-            "purchase": purchases,
-            "cvr": cvr,
-            "cart_abandon": cart_ab,
-            "color": SOURCE_COLORS.get(source, "#444"),
-        })
+    source_agg = _split_aggregates(source_df, "source", SOURCE_COLORS)
     
     # Sort by sessions descending
     source_agg.sort(key=lambda x: x['sessions'], reverse=True)
 
-    # --- Top 4 Source Summary cards ---
-    top_4 = source_agg[:4]
-    src_cols = st.columns(4)
-
-    for idx, s in enumerate(top_4):
-        cvr_color = NEON_GREEN if s["cvr"] >= 2.5 else (NEON_YELLOW if s["cvr"] >= 1.5 else NEON_RED)
-        traffic_share = s["sessions"] / max(sum(x["sessions"] for x in source_agg), 1) * 100
-
-        with src_cols[idx]:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: 3px solid {s['color']}; border-radius: 12px; padding: 16px;">
-                <div style="font-size: 12px; font-weight: 600; color: #FFFFFF; margin-bottom: 4px;">{s['source']}</div>
-                <div style="font-size: 10px; color: #5A6577; margin-bottom: 12px;">{traffic_share:.0f}% of traffic · {format_number(s['sessions'])} sessions</div>
-                <div style="display: flex; justify-content: space-between;">
-                    <div>
-                    <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">CVR</div>
-                        <div style="font-size: 20px; font-weight: 700; color: {cvr_color};">{s['cvr']:.2f}%</div>
-                    </div>
-                    <div>
-                        <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Cart Abn.</div>
-                        <div style="font-size: 20px; font-weight: 700; color: {NEON_YELLOW};">{s['cart_abandon']:.1f}%</div>
-                    </div>
-                    <div>
-                        <div style="font-size: 9px; color: #8892A0; text-transform: uppercase;">Orders</div>
-                        <div style="font-size: 20px; font-weight: 700; color: #FFFFFF;">{format_number(s['purchase'])}</div>
-                    </div>
-                </div>
-            </div>""", unsafe_allow_html=True)
+    # --- Top 4 Source Summary cards (one cached HTML grid) ---
+    st.markdown(_source_cards_html(
+        tuple((s["source"], s["color"], s["sessions"], s["purchase"], s["cvr"], s["cart_abandon"]) for s in source_agg[:4]),
+        sum(s["sessions"] for s in source_agg),
+    ), unsafe_allow_html=True)
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -666,77 +954,46 @@ def _render_source_split(source_df):
         st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 10px;">🎯 CVR by Source</div>""", unsafe_allow_html=True)
 
         sorted_agg = sorted(source_agg, key=lambda x: x["cvr"])
-        fig_cvr = go.Figure()
-
-        fig_cvr.add_trace(go.Bar(
-            x=[s["cvr"] for s in sorted_agg],
-            y=[s["source"] for s in sorted_agg],
-            orientation="h",
-            marker=dict(
-                color=[s["color"] for s in sorted_agg],
-                coloraxis="coloraxis4",
-            ),
-            text=[f"{s['cvr']:.2f}%" for s in sorted_agg],
-            textposition="auto",
-            textfont=dict(color=TEXT_PRIMARY, size=10),
-        ))
-
-        fig_cvr.add_vline(
-            x=2.5, line_dash="dash", line_color=NEON_YELLOW, line_width=1.5,
-            annotation_text="Target: 2.5%",
-            annotation_position="top",
-            annotation_font=dict(color=NEON_YELLOW, size=9),
+        fig_cvr = _source_cvr_fig(
+            tuple(s["source"] for s in sorted_agg),
+            tuple(s["color"] for s in sorted_agg),
+            np.fromiter((s["cvr"] for s in sorted_agg), dtype=float, count=len(sorted_agg)),
         )
-
-        fig_cvr.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color=TEXT_SECONDARY, size=10),
-            xaxis=dict(gridcolor="#1E2330", showgrid=True, zeroline=False),
-            yaxis=dict(gridcolor="rgba(0,0,0,0)", showgrid=False),
-            height=30 * len(source_agg) + 200,
-            margin=dict(l=10, r=20, t=10, b=10),
-            showlegend=False,
-        )
-
         st.plotly_chart(fig_cvr, use_container_width=True)
 
     with col_table:
         # --- Comparative Data Table ---
         st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 10px;">📋 Source Performance Matrix</div>""", unsafe_allow_html=True)
         
-        # Table header
-        st.markdown(f"""
-        <div style="display: grid; grid-template-columns: 1.2fr repeat({len(source_agg)}, 1fr); gap: 2px; margin-bottom: 2px;">
-            <div style="background: #222838; padding: 8px 10px; border-radius: 4px 0 0 0; font-size: 9px; color: #5A6577; text-transform: uppercase;">Metric</div>
-            {"".join(f'<div style="background: #222838; padding: 8px 10px; text-align: center; font-size: 9px; color: {s["color"]}; font-weight: 600; text-transform: uppercase;">{s["source"]}</div>' for s in source_agg)}
-        </div>
-        """, unsafe_allow_html=True)
+        # Table header (the header and every row are collected and sent as one markdown element)
+        parts = [_MATRIX_HEADER_TPL.format(
+            n_cols=len(source_agg),
+            cells="".join(_MATRIX_HEADER_CELL_TPL.format(color=s["color"], label=s["source"]) for s in source_agg),
+        )]
 
         # Table rows
         table_rows = [
             {"label": "Sessions", "key": "sessions", "fmt": "num"},
             {"label": "CVR", "key": "cvr", "fmt": "pct2"},
-            {"label": "Cart Abandon.", "key": "cart_abandon", "fmt": "pct1"},
-            {"label": "Landing → Product", "key": None, "calc": lambda s: s["product"] / max(s["landing"], 1) * 100, "fmt": "pct1"},
-            {"label": "Product → Cart", "key": None, "calc": lambda s: s["cart"] / max(s["product"], 1) * 100, "fmt": "pct1"},
-            {"label": "Cart → Checkout", "key": None, "calc": lambda s: s["checkout"] / max(s["cart"], 1) * 100, "fmt": "pct1"},
-            {"label": "Checkout → Purchase", "key": None, "calc": lambda s: s["purchase"] / max(s["checkout"], 1) * 100, "fmt": "pct1"},
+            {"label": "Cart Abandon.", "key": "cart_abandon", "fmt": "pct1", "best": "min"},
+            {"label": "Landing → Product", "key": "landing_to_product", "fmt": "pct1"},
+            {"label": "Product → Cart", "key": "product_to_cart", "fmt": "pct1"},
+            {"label": "Cart → Checkout", "key": "cart_to_checkout", "fmt": "pct1"},
+            {"label": "Checkout → Purchase", "key": "checkout_to_purchase", "fmt": "pct1"},
             {"label": "Orders", "key": "purchase", "fmt": "num"},
         ]
 
-        for row_idx, row in enumerate(table_rows):
+        # Whole matrix at once (rows x sources), then the best cell per row in one argmax/argmin
+        values_matrix = np.array(
+            [[s[row["key"]] for s in source_agg] for row in table_rows],
+            dtype=float,
+        )
+        # Higher is better except for rows marked "min" (cart abandonment)
+        lower_is_better = np.array([row.get("best") == "min" for row in table_rows])
+        best_per_row = np.where(lower_is_better, values_matrix.argmin(axis=1), values_matrix.argmax(axis=1))
+
+        for row_idx, (row, values, best_idx) in enumerate(zip(table_rows, values_matrix, best_per_row)):
             cells = []
-            values = []
-            for s in source_agg:
-                if row["key"]:
-                    val = s[row["key"]]
-                else:
-                    val = row["calc"](s)
-                values.append(val)
-            best_idx = values.index(max(values)) if row["fmt"] != "pct1" or row["label"] in ["Landing → Product", "Product → Cart", "Cart → Checkout", "Checkout → Purchase"] else values.index(min(values))
-            if row["label"] in ["Cart Abandon.", "Bounce Rate"]:
-                best_idx = values.index(min(values))
             for v_idx, val in enumerate(values):
                 if row["fmt"] == "num":
                     text = format_number(val)
@@ -748,66 +1005,82 @@ def _render_source_split(source_df):
                 is_best = v_idx == best_idx
                 val_color = NEON_GREEN if is_best else TEXT_PRIMARY
 
-                cells.append(f'<div style="background: #1B1F2B; padding: 8px 10px; text-align: center; font-size: 11px; color: {val_color}; font-weight: {"600" if is_best else "400"};">{text}</div>')
-            bg = "#181C27" if row_idx % 2 == 0 else "#1B1F2B"
-            st.markdown(f"""
-            <div style="display: grid; grid-template-columns: 1.2fr repeat({len(source_agg)}, 1fr); gap: 2px; margin-bottom: 2px;">
-                <div style="background: {bg}; padding: 8px 10px; font-size: 10px; color: #8892A0;">{row['label']}</div>
-                {"".join(cells)}
-            </div>""", unsafe_allow_html=True)
+                cells.append(_MATRIX_CELL_TPL.format(color=val_color, weight="600" if is_best else "400", text=text))
+            bg = _ZEBRA_BGS[row_idx & 1]
+            parts.append(_MATRIX_ROW_TPL.format(n_cols=len(source_agg), bg=bg, label=row["label"], cells="".join(cells)))
 
-def render_metric_stack_cro(funnel_df, speed_df):
+        st.markdown(f'<div>{"".join(parts)}</div>', unsafe_allow_html=True)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _metric_stack_aggregates(funnel_df, speed_df):
     """
-    Section 3: The Metric Stack (CRO & Experience)
-    4 core metrics with gauge, trend line, and context:
-    - True CVR: Orders ÷ Human Sessions (>2.5%)
-    - Bounce Rate: Single Page Sessions ÷ Total (<40%)
-    - Cart Abandonment: (Carts - Purchases) ÷ Carts (<70%)
-    - Load Time (LCP): Largest Contentful Paint (<2.5s)
+    Scalars and trend series behind the Metric Stack cards: period averages,
+    7-day vs previous 7-day deltas and date-sorted daily series.
+    Cached on the frames so widget reruns skip the sorts and reductions.
     """
-
-    st.markdown('<div class="section-header">📐 METRIC STACK — CRO & EXPERIENCE</div>', unsafe_allow_html=True)
-
-    sorted_funnel = funnel_df.sort_values("date")
-    sorted_speed = speed_df.sort_values("date")
+    # One date ordering per frame (the funnel order is shared with the trend charts)
+    sorted_funnel = _sorted_funnel(funnel_df)
+    sorted_speed = speed_df.iloc[np.argsort(speed_df["date"].to_numpy(), kind="stable")]
 
     # Calculate aggregate metrics
-    total_orders = funnel_df["purchase"].sum()
-    total_human = funnel_df["human_sessions"].sum()
-    total_carts = funnel_df["add_to_cart"].sum()
+    totals = _funnel_totals(funnel_df)
+    total_orders, total_human, total_carts = totals["purchase"], totals["human_sessions"], totals["add_to_cart"]
     avg_cvr = total_orders / max(total_human, 1) * 100
-    avg_bounce = funnel_df["bounce_rate"].mean()
+    avg_bounce = totals["bounce_rate"]
     avg_cart_ab = (total_carts - total_orders) / max(total_carts, 1) * 100
-    avg_lcp = speed_df["lcp_mobile"].mean()
+    avg_lcp = speed_df["lcp_mobile"].to_numpy().mean()
 
-    # 7-day vs previous 7-day comparison for trend indicators
+    # 7-day vs previous 7-day comparison for trend indicators: the last 14 days viewed as
+    # (previous week, recent week) so both windows of all three rates come from one mean
     if len(sorted_funnel) >= 14:
-        recent_7 = sorted_funnel[-7:] # 7 Hari Terakhir
-        prev_7 = sorted_funnel[-14:-7] # 7 Hari Sebelumnya
-
-        r_cvr = recent_7["true_cvr"].mean()
-        p_cvr = prev_7["true_cvr"].mean()
-        cvr_delta = r_cvr - p_cvr
-
-        r_bounce = recent_7["bounce_rate"].mean()
-        p_bounce = prev_7["bounce_rate"].mean()
-        bounce_delta = r_bounce - p_bounce
-
-        r_cart = recent_7["cart_abandonment"].mean()
-        p_cart = prev_7["cart_abandonment"].mean()
-        cart_delta = r_cart - p_cart
+        rates = sorted_funnel[["true_cvr", "bounce_rate", "cart_abandonment"]].to_numpy()
+        prev_7, recent_7 = rates[-14:].reshape(2, 7, 3).mean(axis=1)
+        cvr_delta, bounce_delta, cart_delta = recent_7 - prev_7
     else:
         cvr_delta = 0
         bounce_delta = 0
         cart_delta = 0
-    
+
     if len(sorted_speed) >= 14:
-        r_lcp = sorted_speed[-7:]["lcp_mobile"].mean()
-        p_lcp = sorted_speed[-14:-7]["lcp_mobile"].mean()
-        lcp_delta = r_lcp - p_lcp
+        prev_lcp, recent_lcp = sorted_speed["lcp_mobile"].to_numpy()[-14:].reshape(2, 7).mean(axis=1)
+        lcp_delta = recent_lcp - prev_lcp
     else:
         lcp_delta = 0
-    
+
+    return {
+        "avg_cvr": avg_cvr,
+        "avg_bounce": avg_bounce,
+        "avg_cart_ab": avg_cart_ab,
+        "avg_lcp": avg_lcp,
+        "cvr_delta": cvr_delta,
+        "bounce_delta": bounce_delta,
+        "cart_delta": cart_delta,
+        "lcp_delta": lcp_delta,
+        "funnel_dates": sorted_funnel["date"].to_numpy(),
+        "cvr_trend": sorted_funnel["true_cvr"].to_numpy(),
+        "bounce_trend": sorted_funnel["bounce_rate"].to_numpy(),
+        "cart_trend": sorted_funnel["cart_abandonment"].to_numpy(),
+        "speed_dates": sorted_speed["date"].to_numpy(),
+        "lcp_trend": sorted_speed["lcp_mobile"].to_numpy(),
+    }
+
+def render_metric_stack_cro(funnel_df, speed_df):
+    """
+    Section 3: The Metric Stack (CRO & Experience)
+    4 core metrics with gauge, trend line, and context:
+    - True CVR: Orders ÷ Human Sessions (>2.5%)
+    - Bounce Rate: Single Page Sessions ÷ Total (<40%)
+    - Cart Abandonment: (Carts - Purchases) ÷ Carts (<70%)
+    - Load Time (LCP): Largest Contentful Paint (<2.5s)
+    """
+
+    st.markdown('<div class="section-header">📐 METRIC STACK — CRO & EXPERIENCE</div>', unsafe_allow_html=True)
+
+    # Aggregates are cached per dataset; unpacked for the metric definitions below
+    agg = _metric_stack_aggregates(funnel_df, speed_df)
+    avg_cvr, avg_bounce, avg_cart_ab, avg_lcp = agg["avg_cvr"], agg["avg_bounce"], agg["avg_cart_ab"], agg["avg_lcp"]
+    cvr_delta, bounce_delta, cart_delta, lcp_delta = agg["cvr_delta"], agg["bounce_delta"], agg["cart_delta"], agg["lcp_delta"]
+
     metrics = [
         {
             "name": '"True" CVR',
@@ -820,9 +1093,9 @@ def render_metric_stack_cro(funnel_df, speed_df):
             "higher_is_better": True,
             "delta": cvr_delta,
             "delta_fmt": f"{cvr_delta:+.2f}%",
-            "trend_data": sorted_funnel["true_cvr"].tolist(),
-            "trend_dates": sorted_funnel["date"].tolist(),
-            "color": NEON_GREEN if avg_cvr >= 2.5 else NEON_RED,
+            "trend_data": agg["cvr_trend"],
+            "trend_dates": agg["funnel_dates"],
+            "color": _status_color(avg_cvr, 2.5),
             "gauge_max": 6.0,
         },
         {
@@ -836,9 +1109,9 @@ def render_metric_stack_cro(funnel_df, speed_df):
             "higher_is_better": False,
             "delta": bounce_delta,
             "delta_fmt": f"{bounce_delta:+.1f}%",
-            "trend_data": sorted_funnel["bounce_rate"].tolist(),
-            "trend_dates": sorted_funnel["date"].tolist(),
-            "color": NEON_GREEN if avg_bounce < 40 else NEON_RED,
+            "trend_data": agg["bounce_trend"],
+            "trend_dates": agg["funnel_dates"],
+            "color": _status_color(avg_bounce, 40, higher_is_better=False),
             "gauge_max": 80.0,
         },
         {
@@ -852,9 +1125,9 @@ def render_metric_stack_cro(funnel_df, speed_df):
             "higher_is_better": False,
             "delta": cart_delta,
             "delta_fmt": f"{cart_delta:+.1f}%",
-            "trend_data": sorted_funnel["cart_abandonment"].tolist(),
-            "trend_dates": sorted_funnel["date"].tolist(),
-            "color": NEON_GREEN if avg_cart_ab < 70 else NEON_RED,
+            "trend_data": agg["cart_trend"],
+            "trend_dates": agg["funnel_dates"],
+            "color": _status_color(avg_cart_ab, 70, higher_is_better=False),
             "gauge_max": 100.0,
         },
         {
@@ -868,48 +1141,51 @@ def render_metric_stack_cro(funnel_df, speed_df):
             "higher_is_better": False,
             "delta": lcp_delta,
             "delta_fmt": f"{lcp_delta:+.1f}s",
-            "trend_data": sorted_speed["lcp_mobile"].tolist(),
-            "trend_dates": sorted_speed["date"].tolist(),
-            "color": NEON_GREEN if avg_lcp < 2.5 else (NEON_YELLOW if avg_lcp < 4.0 else NEON_RED),
+            "trend_data": agg["lcp_trend"],
+            "trend_dates": agg["speed_dates"],
+            "color": _status_color(avg_lcp, 2.5, 4.0, higher_is_better=False),
             "gauge_max": 8.0,
         }
     ]
 
     # --- 4 Metric Cards in 2x2 Grid ---
+    # Per row: both card headers as one HTML grid, both sparklines as one subplot figure, then both footers as one grid
     for row_start in range(0, 4, 2):
-        cols = st.columns(2)
-        for idx, metric in enumerate(metrics[row_start:row_start+2]):
-            with cols[idx]:
-                _render_cro_metric_card(metric)
+        row = metrics[row_start:row_start+2]
+        st.markdown(_CARD_GRID_TPL.format(
+            n_cols=2, cards="".join(_metric_card_head_html(m) for m in row),
+        ), unsafe_allow_html=True)
+        sparklines = tuple(
+            (m["trend_dates"], m["trend_data"], m["color"], m["target"], m["benchmark"])
+            if len(m["trend_data"]) > 1 else None
+            for m in row
+        )
+        if any(sparklines):
+            st.plotly_chart(_sparkline_row_fig(sparklines), use_container_width=True, key=f"trend_row_{row_start}")
+        st.markdown(_CARD_GRID_TPL.format(
+            n_cols=2, cards="".join(_METRIC_CARD_FOOTER_TPL.format(why=m["why"]) for m in row),
+        ) + _METRIC_ROW_SPACER_HTML, unsafe_allow_html=True)
     
     # --- Summary Table ---
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("""<div style="font-size: 10px; color: #5A6577; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 10px;">📋 CRO Metrics Reference Table</div>""", unsafe_allow_html=True)
 
-    # Table header
-    st.markdown(f"""
-    <div style="display: grid; grid-template-columns: 1.2fr 2fr 0.8fr 2fr; gap: 2px; margin-bottom: 2px;">
-        <div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600; border-radius: 4px 0 0 0;">Metric</div>
-        <div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600;">Calculation</div>
-        <div style="background: #222838; padding: 10px 12px; text-align: center; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600;">Benchmark</div>
-        <div style="background: #222838; padding: 10px 12px; font-size: 9px; color: #5A6577; text-transform: uppercase; font-weight: 600; border-radius: 0 4px 0 0;">Why It Matters</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    for idx, metric in enumerate(metrics):
-        bg = "#181C27" if idx % 2 == 0 else "#1B1F2B"
-        st.markdown(f"""
-        <div style="display: grid; grid-template-columns: 1.2fr 2fr 0.8fr 2fr; gap: 2px; margin-bottom: 2px;">
-            <div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: {metric['color']}; font-weight: 600;">{metric['name']}</div>
-            <div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: #FFFFFF;">{metric['calculation']}</div>
-            <div style="background: {bg}; padding: 10px 12px; text-align: center; font-size: 11px; color: #FFFFFF;">{metric['benchmark']}</div>
-            <div style="background: {bg}; padding: 10px 12px; font-size: 11px; color: #FFFFFF;">{metric['why']}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-def _render_cro_metric_card(m):
-    """Render a single CRO metric card with gauge + trend sparkline."""
+    # Header and all rows in one markdown call
+    rows_html = "".join(
+        _METRIC_TABLE_ROW_TPL.format(
+            bg=_ZEBRA_BGS[idx & 1],
+            color=metric["color"],
+            name=metric["name"],
+            calculation=metric["calculation"],
+            benchmark=metric["benchmark"],
+            why=metric["why"],
+        )
+        for idx, metric in enumerate(metrics)
+    )
+    st.markdown(f"<div>{_METRIC_TABLE_HEADER_HTML}{rows_html}</div>", unsafe_allow_html=True)
 
+def _metric_card_head_html(m):
+    """Header (value, status, delta) + gauge bar HTML of a single CRO metric card."""
     # Determine delta arrow and color
     if m["higher_is_better"]:
         delta_good = m["delta"] > 0
@@ -931,81 +1207,84 @@ def _render_cro_metric_card(m):
     # Gauge fill percentage
     gauge_pct = min(m["current"] / max(m["gauge_max"], 1) * 100, 100)
 
-    # Card Header + Value
-    st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-radius: 12px 12px 0 0; padding: 16px 20px;">
-            <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                <div>
-                    <div style="font-size: 10px; color: #8892A0; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px;">{m['name']}</div>
-                    <div style="font-size: 32px; font-weight: 700; color: {m['color']};">{m['value']}</div>
-                </div>
-                <div style="text-align: right;">
-                    <div style="padding: 3px 10px; border-radius: 20px; background: {'rgba(0,255,136,0.12)' if on_track else 'rgba(255,59,92,0.12)'}; font-size: 8px; font-weight: 700; color: {status_color}; text-transform: uppercase; letter-spacing: 0.8px; margin-bottom: 6px;">{status_text}</div>
-                    <div style="font-size: 13px; font-weight: 600; color: {delta_color};">{delta_arrow} {m['delta_fmt']}</div>
-                    <div style="font-size: 8px; color: #5A6577;">vs prev 7 days</div>
-                </div>
-            </div>
-        </div>""", unsafe_allow_html=True)
+    # Card Header + Value + Gauge Bar
+    return _METRIC_CARD_HEAD_TPL.format(
+        name=m["name"],
+        value=m["value"],
+        color=m["color"],
+        status_bg="rgba(0,255,136,0.12)" if on_track else "rgba(255,59,92,0.12)",
+        status_color=status_color,
+        status_text=status_text,
+        delta_color=delta_color,
+        delta_arrow=delta_arrow,
+        delta_fmt=m["delta_fmt"],
+        benchmark=m["benchmark"],
+        gauge_max=m["gauge_max"],
+        gauge_pct=gauge_pct,
+        calculation=m["calculation"],
+    )
 
-    # Gauge Bar
-    st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border-left: 1px solid #2D3348; border-right: 1px solid #2D3348; padding: 0 20px 12px 20px;">
-            <div style="display: flex; justify-content: space-between; font-size: 9px; color: #5A6577; margin-bottom: 4px;">
-                <span>0</span>
-                <span>Target: {m['benchmark']}</span>
-                <span>{m['gauge_max']}</span>
-            </div>
-            <div style="position: relative; width: 100%; height: 8px; background: #2D3348; border-radius: 8px; overflow: hidden;">
-                <div style="height: 100%; width: {gauge_pct:.0f}%; background: linear-gradient(90deg, {m['color']}, {m['color']}88); border-radius: 8px;"></div>
-            </div>
-            <div style="font-size: 9px; color: #8892A0; margin-top: 6px;">{m['calculation']}</div>
-        </div>""", unsafe_allow_html=True)
+# Layout shared by every Metric Stack sparkline row; axis styles are applied to each subplot
+_SPARKLINE_LAYOUT = dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color=TEXT_MUTED, size=9),
+    height=140,
+    margin=dict(l=5, r=5, t=5, b=5),
+    showlegend=False,
+)
+_SPARKLINE_XAXIS = dict(gridcolor="#1E2330", showgrid=False, tickformat="%b %d", showticklabels=True)
+_SPARKLINE_YAXIS = dict(gridcolor="#1E2330", showgrid=True, showticklabels=True)
+
+# Sparkline area fill per metric status color (line color at 6% opacity)
+_SPARKLINE_FILLS = {
+    NEON_GREEN: "rgba(0, 255, 136, 0.06)",
+    NEON_YELLOW: "rgba(255, 215, 0, 0.06)",
+    NEON_RED: "rgba(255, 59, 92, 0.06)",
+}
 
-    # Trend Sparkline (using Plotly)
-    if m["trend_data"] and len(m["trend_data"]) > 1:
-        fig = go.Figure()
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _sparkline_row_fig(sparklines):
+    """
+    Trend sparklines with dashed target lines for one row of Metric Stack cards, as side-by-side subplots.
+    `sparklines` holds one (dates, values, color, target, benchmark) tuple per card; None leaves that slot empty.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=1, cols=len(sparklines), horizontal_spacing=0.06)
+    for col, sparkline in enumerate(sparklines, start=1):
+        if sparkline is None:
+            continue
+        dates, values, color, target, benchmark = sparkline
         fig.add_trace(go.Scatter(
-            x=m["trend_dates"],
-            y=m["trend_data"],
+            x=dates,
+            y=values,
             mode="lines",
-            line=dict(color=m["color"], width=2),
+            line=dict(color=color, width=2),
             fill="tozeroy",
-            fillcolor=f"rgba({int(m['color'][1:3], 16)}, {int(m['color'][3:5], 16)}, {int(m['color'][5:7], 16)}, 0.06)",
+            fillcolor=_SPARKLINE_FILLS[color],
             hovertemplate="%{x|%b %d}: %{y:.2f}<extra></extra>",
-        ))
+        ), row=1, col=col)
 
         # Target line
         fig.add_hline(
-            y=m["target"],
+            y=target,
             line_dash="dash",
             line_color=NEON_YELLOW,
             line_width=1,
-            annotation_text=f"Target: {m['benchmark']}",
+            annotation_text=f"Target: {benchmark}",
             annotation_position="top right",
             annotation_font=dict(color=NEON_YELLOW, size=8),
+            row=1, col=col,
         )
 
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color=TEXT_MUTED, size=9),
-            xaxis=dict(gridcolor="#1E2330", showgrid=False, tickformat="%b %d", showticklabels=True),
-            yaxis=dict(gridcolor="#1E2330", showgrid=True, showticklabels=True),
-            height=140,
-            margin=dict(l=5, r=5, t=5, b=5),
-            showlegend=False,
-        )
-
-        st.plotly_chart(fig, use_container_width=True, key=f"trend_{m['name']}")
-
-    # Card footer — why it matters
-    st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #1B1F2B 0%, #222838 100%); border: 1px solid #2D3348; border-top: none; border-radius: 0 0 12px 12px; padding: 10px 20px;">
-            <div style="font-size: 10px; color: #8892A0; font-style: italic;">💡 {m['why']}</div>
-        </div>""", unsafe_allow_html=True)
-
-    st.markdown("<div style='height: 8px;'></div>", unsafe_allow_html=True)
+    fig.update_layout(_SPARKLINE_LAYOUT)
+    fig.update_xaxes(_SPARKLINE_XAXIS)
+    fig.update_yaxes(_SPARKLINE_YAXIS)
+    return fig
 
+@st.fragment
 def render_ai_brain_cro(funnel_df, speed_df, device_df):
     """
     Section 4: The AI Brain Logic (The CRO Expert)
@@ -1014,6 +1293,8 @@ def render_ai_brain_cro(funnel_df, speed_df, device_df):
     Logic A (Tech Check): Mobile CVR vs Load Time correlation
     Logic B (Offer Mismatch): Ad CTR vs Bounce Rate gap
     Logic C (Friction Monitor): Checkout abandonment detection
+
+    Runs as a fragment so the Generate button only reruns this section.
     """
     st.markdown('<div class="section-header">🧠 AI BRAIN — THE CRO EXPERT</div>', unsafe_allow_html=True)
 
@@ -1039,95 +1320,148 @@ def render_ai_brain_cro(funnel_df, speed_df, device_df):
         if st.button("🧠 Generate Fresh CRO Insights", key="ai_cro_insights", use_container_width=True, type="primary"):
             st.info("🔌 OpenAI API integration pending. Insights above are placeholder data based on current metrics.")
 
+# Insight copy per logic outcome: title/body are str.format templates, recommendations are fixed
+_INSIGHT_COPY = {
+    "tech_check": {
+        "title": "Mobile CVR dropped {cvr_change:.0f}% overnight. Load time spiked to {recent_lcp:.1f}s.",
+        "body": "Mobile LCP increased from {prev_lcp:.1f}s to {recent_lcp:.1f}s ({lcp_change:+.0f}%) "
+                "in the last 3 days. Mobile CVR is now {recent_mobile_cvr:.2f}%. "
+                "Every +1 second of load time costs you approximately 20% in conversions.",
+        "recommendation": "Check recent Shopify app installs or theme updates. "
+                          "Audit third-party scripts in theme.liquid. "
+                          "Run Google PageSpeed Insights and fix Critical issues first.",
+    },
+    "offer_mismatch": {
+        "title": "High Bounce Rate ({avg_bounce:.0f}%) detected. Landing Page may not deliver on Ad promise.",
+        "body": "Bounce Rate is {avg_bounce:.1f}% with a CVR of only {avg_cvr:.2f}%. "
+                "This pattern suggests visitors are arriving with expectations set by your ads, "
+                "but the Landing Page content doesn't match what was promised.",
+        "recommendation": "Match Landing Page headline to Ad copy exactly. "
+                          "Ensure the product shown in ads is above-the-fold on the landing page. "
+                          "A/B test a dedicated landing page vs. sending traffic to the homepage.",
+    },
+    "offer_aligned": {
+        "title": "Landing Page alignment is healthy. Bounce Rate at {avg_bounce:.0f}%.",
+        "body": "Bounce Rate ({avg_bounce:.1f}%) is within the healthy range (<40%). "
+                "Your ads and landing pages are well-aligned — visitors are staying and browsing.",
+        "recommendation": "Maintain current ad-to-landing-page consistency. "
+                          "Consider testing more aggressive offers to push CVR higher.",
+    },
+    "friction_high": {
+        "title": "Checkout Abandonment is abnormally high ({checkout_abandon:.0f}%). Check shipping settings or payment gateway.",
+        "body": "Cart-to-Purchase abandonment is {checkout_abandon:.1f}% (target: <70%). "
+                "Recent trend shows {cart_ab_change:+.1f}% change vs previous period. "
+                "This is costing you approximately {lost_orders} lost orders.",
+        "recommendation": "Check if shipping costs are visible before checkout (surprise costs = #1 abandonment reason). "
+                          "Verify payment gateway is processing correctly. "
+                          "Consider adding express checkout (Shop Pay, Apple Pay) to reduce friction.",
+    },
+    "friction_ok": {
+        "title": "Checkout friction is within healthy range ({checkout_abandon:.0f}%).",
+        "body": "Cart-to-Purchase abandonment at {checkout_abandon:.1f}% is below the 70% threshold. "
+                "Your checkout flow is performing well relative to e-commerce benchmarks.",
+        "recommendation": "Maintain current checkout UX. Consider testing one-page checkout vs. multi-step. "
+                          "Add trust badges and money-back guarantee near the payment button.",
+    },
+}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _device_series(device_df, col):
+    """
+    `col` split into one array per device. Rows arrive date-sorted from the loader and
+    groupby keeps row order within each group, so every array is already in date order.
+    """
+    return {
+        device: values.to_numpy()
+        for device, values in device_df.groupby("device", sort=False, observed=True)[col]
+    }
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def _generate_cro_insights(funnel_df, speed_df, device_df):
     """
     Generate placeholder CRO insights matching the brief's tone.
     Short, punchy, actionable — like a real CRO expert.
+    Cached on the (date-filtered) frames, so only a date range change recomputes them.
     """
     insights = []
-    sorted_funnel = funnel_df.sort_values("date")
-    sorted_speed = speed_df.sort_values("date")
+    # Date-ordered series: the funnel order is the cached one, speed is one argsort
+    sorted_funnel = _sorted_funnel(funnel_df)
+    lcp = speed_df["lcp_mobile"].to_numpy()[np.argsort(speed_df["date"].to_numpy(), kind="stable")]
 
     # --- Logic A: Tech Check ---
     # Compare recent mobile CVR vs LCP spike
-    if len(sorted_funnel) >= 7 and len(sorted_speed) >= 7:
-        recent_lcp = sorted_speed.tail(3)["lcp_mobile"].mean()
-        prev_lcp = sorted_speed.iloc[-7:-3]["lcp_mobile"].mean()
+    if len(sorted_funnel) >= 7 and len(lcp) >= 7:
+        recent_lcp = lcp[-3:].mean()
+        prev_lcp = lcp[-7:-3].mean()
         lcp_change = ((recent_lcp - prev_lcp) / max(prev_lcp, 1)) * 100
 
         # Mobile CVR from device data
-        mobile_df = device_df[device_df["device"] == "Mobile"]
-        if len(mobile_df) >= 7:
-            mobile_sorted = mobile_df.sort_values("date")
-            recent_mobile_cvr = mobile_sorted.tail(3)["cvr"].mean()
-            prev_mobile_cvr = mobile_sorted.iloc[-7:-3]["cvr"].mean()
+        mobile_cvr = _device_series(device_df, "cvr").get("Mobile", np.empty(0))
+        if len(mobile_cvr) >= 7:
+            recent_mobile_cvr = mobile_cvr[-3:].mean()
+            prev_mobile_cvr = mobile_cvr[-7:-3].mean()
             cvr_change = ((recent_mobile_cvr - prev_mobile_cvr) / max(prev_mobile_cvr, 1)) * 100
         else:
-            recent_mobile_cvr = mobile_df["cvr"].mean() if len(mobile_df) > 0 else 0
+            recent_mobile_cvr = mobile_cvr.mean() if len(mobile_cvr) > 0 else 0
             cvr_change = 0
 
         severity = "critical" if recent_lcp > 4.0 else ("warning" if recent_lcp > 2.5 else "info")
+        copy = _INSIGHT_COPY["tech_check"]
 
         insights.append({
             "logic_id": "A",
             "logic_name": "Tech Check",
             "icon": "⚡",
             "severity": severity,
-            "title": f"Mobile CVR dropped {abs(cvr_change):.0f}% overnight. Load time spiked to {recent_lcp:.1f}s.",
-            "body": f"Mobile LCP increased from {prev_lcp:.1f}s to {recent_lcp:.1f}s ({lcp_change:+.0f}%) "
-                    f"in the last 3 days. Mobile CVR is now {recent_mobile_cvr:.2f}%. "
-                    f"Every +1 second of load time costs you approximately 20% in conversions.",
-            "recommendation": "Check recent Shopify app installs or theme updates. "
-                            "Audit third-party scripts in theme.liquid. "
-                            "Run Google PageSpeed Insights and fix Critical issues first.",
+            "title": copy["title"].format(cvr_change=abs(cvr_change), recent_lcp=recent_lcp),
+            "body": copy["body"].format(
+                prev_lcp=prev_lcp, recent_lcp=recent_lcp, lcp_change=lcp_change, recent_mobile_cvr=recent_mobile_cvr,
+            ),
+            "recommendation": copy["recommendation"],
             "accent_color": NEON_RED if severity == "critical" else NEON_YELLOW,
         })
 
     # --- Logic B: Offer Mismatch ---
     # High sessions but high bounce = landing page not matching ad promise
-    avg_bounce = funnel_df["bounce_rate"].mean()
-    avg_cvr = funnel_df["true_cvr"].mean()
+    totals = _funnel_totals(funnel_df)
+    avg_bounce, avg_cvr = totals["bounce_rate"], totals["true_cvr"]
 
     if avg_bounce > 38:
         severity = "critical" if avg_bounce > 50 else "warning"
+        copy = _INSIGHT_COPY["offer_mismatch"]
         insights.append({
             "logic_id": "B",
             "logic_name": "Offer Mismatch",
             "icon": "🎯",
             "severity": severity,
-            "title": f"High Bounce Rate ({avg_bounce:.0f}%) detected. Landing Page may not deliver on Ad promise.",
-            "body": f"Bounce Rate is {avg_bounce:.1f}% with a CVR of only {avg_cvr:.2f}%. "
-                    f"This pattern suggests visitors are arriving with expectations set by your ads, "
-                    f"but the Landing Page content doesn't match what was promised.",
-            "recommendation": "Match Landing Page headline to Ad copy exactly. "
-                            "Ensure the product shown in ads is above-the-fold on the landing page. "
-                            "A/B test a dedicated landing page vs. sending traffic to the homepage.",
+            "title": copy["title"].format(avg_bounce=avg_bounce),
+            "body": copy["body"].format(avg_bounce=avg_bounce, avg_cvr=avg_cvr),
+            "recommendation": copy["recommendation"],
             "accent_color": NEON_ORANGE,
         })
     else:
+        copy = _INSIGHT_COPY["offer_aligned"]
         insights.append({
             "logic_id": "B",
             "logic_name": "Offer Mismatch",
             "icon": "🎯",
             "severity": "success",
-            "title": f"Landing Page alignment is healthy. Bounce Rate at {avg_bounce:.0f}%.",
-            "body": f"Bounce Rate ({avg_bounce:.1f}%) is within the healthy range (<40%). "
-                    f"Your ads and landing pages are well-aligned — visitors are staying and browsing.",
-            "recommendation": "Maintain current ad-to-landing-page consistency. "
-                            "Consider testing more aggressive offers to push CVR higher.",
+            "title": copy["title"].format(avg_bounce=avg_bounce),
+            "body": copy["body"].format(avg_bounce=avg_bounce),
+            "recommendation": copy["recommendation"],
             "accent_color": NEON_GREEN,
         })
 
     # --- Logic C: Friction Monitor ---
     # Checkout abandonment analysis
-    total_carts = funnel_df["add_to_cart"].sum()
-    total_purchases = funnel_df["purchase"].sum()
+    total_carts, total_purchases = totals["add_to_cart"], totals["purchase"]
     checkout_abandon = (total_carts - total_purchases) / max(total_carts, 1) * 100
 
     # Check for recent spike
     if len(sorted_funnel) >= 7:
-        recent_cart_ab = sorted_funnel.tail(3)["cart_abandonment"].mean()
-        prev_cart_ab = sorted_funnel.iloc[-7:-3]["cart_abandonment"].mean()
+        cart_ab = sorted_funnel["cart_abandonment"].to_numpy()
+        recent_cart_ab = cart_ab[-3:].mean()
+        prev_cart_ab = cart_ab[-7:-3].mean()
         cart_ab_change = recent_cart_ab - prev_cart_ab
     else:
         recent_cart_ab = checkout_abandon
@@ -1135,31 +1469,31 @@ def _generate_cro_insights(funnel_df, speed_df, device_df):
 
     if checkout_abandon > 65:
         severity = "critical" if checkout_abandon > 75 else "warning"
+        copy = _INSIGHT_COPY["friction_high"]
         insights.append({
             "logic_id": "C",
             "logic_name": "Friction Monitor",
             "icon": "🚧",
             "severity": severity,
-            "title": f"Checkout Abandonment is abnormally high ({checkout_abandon:.0f}%). Check shipping settings or payment gateway.",
-            "body": f"Cart-to-Purchase abandonment is {checkout_abandon:.1f}% (target: <70%). "
-                    f"Recent trend shows {cart_ab_change:+.1f}% change vs previous period. "
-                    f"This is costing you approximately {format_number(total_carts - total_purchases)} lost orders.",
-            "recommendation": "Check if shipping costs are visible before checkout (surprise costs = #1 abandonment reason). "
-                            "Verify payment gateway is processing correctly. "
-                            "Consider adding express checkout (Shop Pay, Apple Pay) to reduce friction.",
+            "title": copy["title"].format(checkout_abandon=checkout_abandon),
+            "body": copy["body"].format(
+                checkout_abandon=checkout_abandon,
+                cart_ab_change=cart_ab_change,
+                lost_orders=format_number(total_carts - total_purchases),
+            ),
+            "recommendation": copy["recommendation"],
             "accent_color": NEON_RED if severity == "critical" else NEON_ORANGE,
         })
     else:
+        copy = _INSIGHT_COPY["friction_ok"]
         insights.append({
             "logic_id": "C",
             "logic_name": "Friction Monitor",
             "icon": "🚧",
             "severity": "success",
-            "title": f"Checkout friction is within healthy range ({checkout_abandon:.0f}%).",
-            "body": f"Cart-to-Purchase abandonment at {checkout_abandon:.1f}% is below the 70% threshold. "
-                    f"Your checkout flow is performing well relative to e-commerce benchmarks.",
-            "recommendation": "Maintain current checkout UX. Consider testing one-page checkout vs. multi-step. "
-                            "Add trust badges and money-back guarantee near the payment button.",
+            "title": copy["title"].format(checkout_abandon=checkout_abandon),
+            "body": copy["body"].format(checkout_abandon=checkout_abandon),
+            "recommendation": copy["recommendation"],
             "accent_color": NEON_GREEN,
         })
 
@@ -1176,46 +1510,29 @@ def _render_cro_insight_card(insight):
     }
 
     sev = severity_config.get(insight["severity"], severity_config["info"])
-    accent = insight["accent_color"]
-
-    # Card Header
-    st.markdown(f"""
-        <div style="background: {sev['bg']}; border: 1px solid {sev['border']}; border-radius: 12px 12px 0 0; padding: 14px 20px;">
-            <div style="display: flex; align-items: center; justify-content: space-between;">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 22px;">{insight['icon']}</span>
-                    <div>
-                        <div style="font-size: 20px; font-weight: 600; color: #FFFFFF;">{insight['title']}</div>
-                        <div style="font-size: 15px; color: #5A6577; margin-top: 2px;">Logic {insight['logic_id']}: {insight['logic_name']}</div>
-                    </div>
-                </div>
-                <div style="padding: 3px 10px; border-radius: 20px; background: {sev['label_bg']}; font-size: 9px; font-weight: 700; color: {sev['label_color']}; text-transform: uppercase; letter-spacing: 1px;">{sev['label']}</div>
-            </div>
-        </div>""", unsafe_allow_html=True)
-
-    # Card Body
-    st.markdown(f"""
-        <div style="background: {sev['bg']}; border-left: 1px solid {sev['border']}; border-right: 1px solid {sev['border']}; padding: 0 20px 12px 20px;">
-            <div style="font-size: 15px; color: #C0C7D0; line-height: 1.7; padding: 10px 14px; background: rgba(0,0,0,0.15); border-radius: 8px;">
-                <span style="font-size: 9px; color: #5A6577; text-transform: uppercase; letter-spacing: 1px; display: block; margin-bottom: 6px;">📊 Analysis</span>
-                {insight['body']}
-            </div>
-        </div>""", unsafe_allow_html=True)
-
-    # Card Footer
-    st.markdown(f"""
-        <div style="background: {sev['bg']}; border: 1px solid {sev['border']}; border-top: none; border-radius: 0 0 12px 12px; padding: 0 20px 14px 20px;">
-            <div style="font-size: 15px; color: #C0C7D0; line-height: 1.7; padding: 10px 14px; background: rgba(0,0,0,0.1); border-radius: 8px; border-left: 3px solid {accent};">
-                <span style="font-size: 9px; color: {accent}; text-transform: uppercase; letter-spacing: 1px; display: block; margin-bottom: 6px;">💡 Recommendation</span>
-                {insight['recommendation']}
-            </div>
-        </div>""", unsafe_allow_html=True)
 
-    st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+    st.markdown(_INSIGHT_CARD_TPL.format(
+        bg=sev["bg"],
+        border=sev["border"],
+        label_bg=sev["label_bg"],
+        label_color=sev["label_color"],
+        label=sev["label"],
+        accent=insight["accent_color"],
+        icon=insight["icon"],
+        title=insight["title"],
+        logic_id=insight["logic_id"],
+        logic_name=insight["logic_name"],
+        body=insight["body"],
+        recommendation=insight["recommendation"],
+    ), unsafe_allow_html=True)
 
 # ============================================================
 # 3. COMPONENT RENDERERS (Placeholder for visualization)
 # ============================================================
+def _since(df, cutoff):
+    """Rows of a date-sorted frame on or after `cutoff`: one binary search instead of a boolean mask"""
+    return df.iloc[np.searchsorted(df["date"].to_numpy(), np.datetime64(cutoff), side="left"):]
+
 def show_cro_terminal():
     """
     Main entry point for Module 3: CRO Terminal.
@@ -1233,8 +1550,8 @@ def show_cro_terminal():
     </div>
     """,unsafe_allow_html= True)
 
-    # --- Date range & Filter
-    col_f1, col_f2, col_f3 = st.columns([2,2,6])
+    # --- Date range (the Traffic View filter lives in the Bouncer fragment)
+    col_f1, col_f2 = st.columns([2,8])
     with col_f1:
         date_range = st.selectbox(
             "📅 Time Range",
@@ -1242,39 +1559,38 @@ def show_cro_terminal():
             index=2,
             key="cro_date_range"
         )
-    with col_f2:
-        traffic_view = st.selectbox(
-            "👁️ Traffic View",
-            ["True Human Traffic", "All Traffic (inc. Bots)"],
-            index=0,
-            key="cro_traffic_view"
-        )
     
     # --- Generate Data ---
     days_map = {"Last 7 Days": 7, "Last 14 Days": 14, "Last 30 Days": 30}
     days = days_map.get(date_range, 30)
 
-    loader = DataLoader()
+    from utils.data_loader import get_data_loader
+
+    loader = get_data_loader()
     traffic_df = loader.load_traffic_data()
     funnel_df = loader.load_funnel_module3_data()
     device_df = loader.load_funnel_by_device()
     source_df = loader.load_funnel_by_source()
     speed_df = loader.load_page_speed_data()
 
-    # Filter data based on date range
+    # Filter data based on date range (frames arrive date-sorted, so each window is a tail slice)
     cutoff_date = datetime.now() - timedelta(days=days)
-    traffic_df = traffic_df[traffic_df['date'] >= cutoff_date]
-    funnel_df = funnel_df[funnel_df['date'] >= cutoff_date]
-    device_df = device_df[device_df['date'] >= cutoff_date]
-    source_df = source_df[source_df['date'] >= cutoff_date]
-    speed_df = speed_df[speed_df['date'] >= cutoff_date]
+    traffic_df = _since(traffic_df, cutoff_date)
+    funnel_df = _since(funnel_df, cutoff_date)
+    device_df = _since(device_df, cutoff_date)
+    source_df = _since(source_df, cutoff_date)
+    speed_df = _since(speed_df, cutoff_date)
+
+    # Every section below reduces these windows; stop before they hit empty arrays
+    if any(df.empty for df in (traffic_df, funnel_df, device_df, source_df, speed_df)):
+        st.info("No CRO data in the selected date range — regenerate the Module 3 data to refresh it.")
+        return
 
     # --- Data Summary for verification ---
     st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
 
     # Show "The Bouncer" - Bot filter Stats (includes KPI row)
-    is_filtered = traffic_view == "True Human Traffic"
-    render_bot_filter_stats(traffic_df, is_filtered, funnel_df, speed_df)
+    render_bouncer_section(traffic_df, funnel_df, speed_df)
 
     st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
 
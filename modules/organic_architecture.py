@@ -4,9 +4,12 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 import random
 
-from utils.data_loader import DataLoader
+from utils.data_loader import df_records, get_data_loader
 
 # ============================================================
 # 1. THEME CONSTANTS
@@ -25,44 +28,84 @@ TEXT_PRIMARY = "#FFFFFF"
 TEXT_SECONDARY = "#8892A0"
 TEXT_MUTED = "#5A6577"
 
-# Platform Colors
-PLATFORM_COLORS = {
-    "Instagram": "#E1306C",
-    "TikTok": "#00F2EA",
-    "YouTube": "#FF0000",
-    "LinkedIn": "#0A66C2"
-}
-
-PLATFORM_ICONS = {
-    "Instagram": "📸",
-    "TikTok": "🎵",
-    "YouTube": "🎬",
-    "LinkedIn": "💼"
-}
+# Platforms in display order: (name, color, icon)
+_PLATFORMS = (
+    ("Instagram", "#E1306C", "📸"),
+    ("TikTok", "#00F2EA", "🎵"),
+    ("YouTube", "#FF0000", "🎬"),
+    ("LinkedIn", "#0A66C2", "💼"),
+)
+
+# Read-only lookups by platform name: (color, icon) together, since render code needs both
+PLATFORM_META = MappingProxyType({name: (color, icon) for name, color, icon in _PLATFORMS})
+PLATFORM_COLORS = MappingProxyType({name: color for name, color, _ in _PLATFORMS})
+PLATFORM_ICONS = MappingProxyType({name: icon for name, _, icon in _PLATFORMS})
+
+# (color, icon) for a platform missing from _PLATFORMS
+_UNKNOWN_PLATFORM = ("#FFFFFF", "📄")
+
+def _hex_rgb(hex_color):
+    """'#RRGGBB' -> (r, g, b), decoding all three channel bytes in one bytes.fromhex call"""
+    return tuple(bytes.fromhex(hex_color[1:]))
+
+# Platform colors as RGB tuples, parsed once for the translucent rgba() fills
+PLATFORM_RGB = MappingProxyType({name: _hex_rgb(color) for name, color, _ in _PLATFORMS})
+
+def _card_gradient(rgb):
+    """Content-card thumbnail gradient: the platform color fading from 0.3 to 0.08 alpha"""
+    r, g, b = rgb
+    return f"linear-gradient(135deg, rgba({r},{g},{b},0.3) 0%, rgba({r},{g},{b},0.08) 100%)"
+
+# Thumbnail gradients formatted once at import; cards only look them up
+PLATFORM_GRADIENTS = MappingProxyType({name: _card_gradient(rgb) for name, rgb in PLATFORM_RGB.items()})
+_UNKNOWN_GRADIENT = _card_gradient(_hex_rgb(_UNKNOWN_PLATFORM[0]))
+
+CSS_PATH = Path(__file__).parent.parent / 'assets' / 'module2_organic.css'
+
+@st.cache_resource
+def _css_block(path):
+    """Stylesheet wrapped in a <style> tag, read once per server process instead of on every rerun."""
+    return f"<style>{Path(path).read_bytes().decode('utf-8')}</style>"
 
 def load_module2_css():
     """Load custom CSS for Organic Architecture module"""
-    import os
-    css_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'module2_organic.css')
     try:
-        with open(css_path) as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        css_block = _css_block(CSS_PATH)
     except FileNotFoundError:
-        # Fallback: try loading from relative path
-        try:
-            with open('assets/module2_organic.css') as f:
-                st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-        except FileNotFoundError:
-            st.error("CSS file for Organic Architecture module not found.")
+        st.error("CSS file for Organic Architecture module not found.")
+        return
+    st.markdown(css_block, unsafe_allow_html=True)
+
+# Gradient rule drawn between the page sections
+_SECTION_DIVIDER_HTML = '<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>'
 
+# (divisor, suffix) indexed by how many thresholds (1K, 1M) a number clears
+_NUMBER_SCALES = ((1, ""), (1_000, "K"), (1_000_000, "M"))
+
+# typed: values under 1K keep their own repr (5 vs 5.0), so int and float keys must not share entries
+@lru_cache(maxsize=4096, typed=True)
 def format_number(num):
     """Format large numbers: 1500 -> 1.5K, 1500000 -> 1.5M"""
-    if num >= 1_000_000:
-        return f"{num / 1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num / 1_000:.1f}K"
-    else:
+    idx = int(num >= 1_000) + int(num >= 1_000_000)
+    if not idx:
         return str(num)
+    divisor, suffix = _NUMBER_SCALES[idx]
+    return f"{num / divisor:.1f}{suffix}"
+
+def format_number_array(values):
+    """
+    format_number over a whole column: one vectorized divide per scale instead of a Python
+    branch + divide per cell. Returns an object array of the same strings format_number gives.
+    """
+    values = np.asarray(values)
+    idx = (values >= 1_000).astype(np.intp) + (values >= 1_000_000)
+    out = values.astype(str).astype(object)
+    for scale in (1, 2):
+        mask = idx == scale
+        if mask.any():
+            divisor, suffix = _NUMBER_SCALES[scale]
+            out[mask] = [f"{v:.1f}{suffix}" for v in values[mask] / divisor]
+    return out
 
 # ============================================================
 # 2. COMPONENT
@@ -75,26 +118,31 @@ def render_cross_channel_pulse(df):
     """
     st.markdown('<div class="section-header">📈 Cross-Channel Pulse — Ticker Tape</div>', unsafe_allow_html=True)
 
+    # Latest follower count and growth sum/mean per platform, in one grouped pass
+    stats = df.groupby('platform', sort=False, observed=True).agg(
+        followers=('followers', 'last'),
+        growth_sum=('follower_growth', 'sum'),
+        growth_mean=('follower_growth', 'mean'),
+    )
+
     # Create columns for each platform
     cols = st.columns(4)
 
-    for idx, platform in enumerate(['Instagram', 'TikTok', 'YouTube', 'LinkedIn']):
-        platform_data = df[df['platform'] == platform]
-        current_followers = platform_data['followers'].iloc[-1]
-        total_growth = platform_data['follower_growth'].sum()
+    for idx, (platform, color, icon) in enumerate(_PLATFORMS):
+        current_followers = stats.at[platform, 'followers']
+        total_growth = stats.at[platform, 'growth_sum']
         growth_pct = (total_growth / (current_followers - total_growth)) * 100 if (current_followers - total_growth) > 0 else 0
-        avg_daily_growth = platform_data['follower_growth'].mean()
+        avg_daily_growth = stats.at[platform, 'growth_mean']
 
         # Determine color based on growth
         is_positive = total_growth >= 0
         growth_class = "ticker-growth-positive" if is_positive else "ticker-growth-negative"
         growth_arrow = "▲" if is_positive else "▼"
-        color = PLATFORM_COLORS[platform]
 
         with cols[idx]:
             st.markdown(f"""
             <div class="ticker-card" style="border-top: 3px solid {color};">
-                <div class="ticker-platform">{PLATFORM_ICONS[platform]} {platform}</div>
+                <div class="ticker-platform">{icon} {platform}</div>
                 <div class="metric-value">{current_followers:,}</div>
                 <div class="{growth_class}">
                     {growth_arrow} {abs(total_growth):,} ({growth_pct:+.1f}%)
@@ -105,22 +153,14 @@ def render_cross_channel_pulse(df):
             </div>
             """, unsafe_allow_html=True)
 
-def content_library_section(platform_filter):
+def content_library_section(content_df):
     """
     View Mode 2: Content Library
     Thumbnail Grid of posts, sortable by Virality Score or Conversion Score.
-    Includes Grid View and Table View toggle, pagination, and platform filter.
+    Includes Grid View and Table View toggle and pagination; `content_df` arrives already platform-filtered.
     """
     st.markdown('<div class="section-header">📚 CONTENT LIBRARY — POST PERFORMANCE</div>', unsafe_allow_html=True)
 
-    # Generate content library data
-    load_data = DataLoader()
-    content_df = load_data.load_content_library()  # Assuming social data has post details
-
-    # Apply platform filter
-    if platform_filter:
-        content_df = content_df[content_df['platform'].isin(platform_filter)]
-    
     if content_df.empty:
         st.info("No posts available for the selected filters.")
         return
@@ -164,7 +204,9 @@ def content_library_section(platform_filter):
     }
 
     sort_col, sort_asc = sort_map.get(sort_by, ("virality_score", False))
-    content_df = content_df.sort_values(by=sort_col, ascending=sort_asc).reset_index(drop=True)
+    # Full sort, not nlargest(end_idx) per page: with tied scores/dates, top-n cuts of different
+    # sizes can order the ties differently and repeat or skip posts across pages
+    content_df = content_df.sort_values(by=sort_col, ascending=sort_asc)
 
     # Pagination
     ITEMS_PER_PAGE = 9
@@ -206,94 +248,79 @@ def content_library_section(platform_filter):
     # --- Pagination Controls ---
     render_pagination(current_page, total_pages)
 
+# Content Library grid card; cards are joined into _CONTENT_GRID_TPL and emitted in one st.markdown
+_CONTENT_CARD_TPL = (
+    '<div class="content-card">'
+    '<div class="card-thumbnail" style="background: {gradient};">'
+    '<span class="card-thumbnail-platform" style="background: {color};">{icon} {platform}</span>'
+    '<span class="card-thumbnail-date">{date}</span>'
+    '<span class="card-thumbnail-icon">{icon}</span>'
+    '<span class="card-thumbnail-type">{content_type}</span>'
+    '</div>'
+    '<div class="card-body">'
+    '<div class="card-title">{title}</div>'
+    '<div class="card-metrics">'
+    '<div class="card-metric-item"><div class="metric-value">{views}</div><div class="card-metric-label">Views</div></div>'
+    '<div class="card-metric-item"><div class="metric-value">{likes}</div><div class="card-metric-label">Likes</div></div>'
+    '<div class="card-metric-item"><div class="metric-value">{shares}</div><div class="card-metric-label">Shares</div></div>'
+    '</div>'
+    '<div class="card-metrics">'
+    '<div class="card-metric-item"><div class="metric-value">{comments}</div><div class="card-metric-label">Comments</div></div>'
+    '<div class="card-metric-item"><div class="metric-value">{saves}</div><div class="card-metric-label">Saves</div></div>'
+    '<div class="card-metric-item"><div class="metric-value">{link_clicks}</div><div class="card-metric-label">Clicks</div></div>'
+    '</div>'
+    '<div class="card-scores">'
+    '<div class="score-badge score-badge-virality">🔥 Virality: {vs}%</div>'
+    '<div class="score-badge score-badge-conversion">🎯 Conv: {cs}%</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+
+_CONTENT_GRID_TPL = '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px;">{cards}</div>'
+
 def render_content_grid(page_df):
     """Render content as visual grid cards with placeholder thumbnails."""
 
-    # Use st.columns to create a grid layout
-    cols_per_row = 3
-    rows_needed = (len(page_df) + cols_per_row - 1) // cols_per_row
-
-    for row_idx in range (rows_needed):
-        cols = st.columns(cols_per_row)
-        for col_idx in range(cols_per_row):
-            item_idx = row_idx * cols_per_row + col_idx
-            if item_idx >= len(page_df):
-                break
-                
-            post = page_df.iloc[item_idx]
-            platform = post['platform']
-            color = PLATFORM_COLORS.get(platform, "#FFFFFF")
-            icon = PLATFORM_ICONS.get(platform, "📄")
-
-            # Generate gradient based on platform color
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            gradient = f"linear-gradient(135deg, rgba({r},{g},{b},0.3) 0%, rgba({r},{g},{b},0.08) 100%)"
-
-            # Virality score color
-            # Green >=3.0, Yellow >=1.5, Red <1.5
-            vs = post['virality_score']
-            vs_color = NEON_GREEN if vs >= 3.0 else (NEON_YELLOW if vs >= 1.5 else NEON_RED)
-
-            # Conversion score color
-            # Green >=3.0, Yellow >=1.5, Red <1.5
-            cs = post['conversion_score']
-            cs_color = NEON_GREEN if cs >= 3.0 else (NEON_YELLOW if cs >= 1.5 else NEON_RED)
-
-            with cols[col_idx]:
-                st.markdown(f"""
-                <div class="content-card">
-                    <div class="card-thumbnail" style="background: {gradient};">
-                        <span class="card-thumbnail-platform" style="background: {color};">{icon} {platform}</span>
-                        <span class="card-thumbnail-date">{post['date']}</span>
-                        <span class="card-thumbnail-icon">{icon}</span>
-                        <span class="card-thumbnail-type">{post['content_type']}</span>
-                    </div>
-                    <div class="card-body">
-                        <div class="card-title">{post['title']}</div>
-                        <div class="card-metrics">
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['views'])}</div>
-                                <div class="card-metric-label">Views</div>
-                            </div>
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['likes'])}</div>
-                                <div class="card-metric-label">Likes</div>
-                            </div>
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['shares'])}</div>
-                                <div class="card-metric-label">Shares</div>
-                            </div>
-                        </div>
-                        <div class="card-metrics">
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['comments'])}</div>
-                                <div class="card-metric-label">Comments</div>
-                            </div>
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['saves'])}</div>
-                                <div class="card-metric-label">Saves</div>
-                            </div>
-                            <div class="card-metric-item">
-                                <div class="metric-value">{format_number(post['link_clicks'])}</div>
-                                <div class="card-metric-label">Clicks</div>
-                            </div>
-                        </div>
-                        <div class="card-scores">
-                            <div class="score-badge score-badge-virality">
-                                🔥 Virality: {post['virality_score']}%
-                            </div>
-                            <div class="score-badge score-badge-conversion">
-                                🎯 Conv: {post['conversion_score']}%
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-                # Small spacer between rows
-                st.markdown("<div style='height: 4px;'></div>", unsafe_allow_html=True)
+    # Card fields as plain per-row tuples instead of a page_df.iloc Series per card;
+    # dates stay Timestamps (tolist) so they print exactly as before
+    records = df_records(page_df, ['platform', 'title', 'content_type', 'virality_score', 'conversion_score'])
+    dates = page_df['date'].tolist()
+    # Count columns are formatted column-at-a-time rather than six format_number calls per card
+    counts = [format_number_array(page_df[col].to_numpy()) for col in ('views', 'likes', 'shares', 'comments', 'saves', 'link_clicks')]
+
+    cards = []
+    for (platform, title, content_type, vs, cs), date, views, likes, shares, comments, saves, link_clicks in zip(records, dates, *counts):
+        color, icon = PLATFORM_META.get(platform, _UNKNOWN_PLATFORM)
+        cards.append(_CONTENT_CARD_TPL.format(
+            # Gradient based on platform color
+            gradient=PLATFORM_GRADIENTS.get(platform, _UNKNOWN_GRADIENT),
+            color=color, icon=icon, platform=platform, date=date, content_type=content_type, title=title,
+            views=views, likes=likes, shares=shares, comments=comments, saves=saves, link_clicks=link_clicks,
+            vs=vs, cs=cs,
+        ))
+
+    # The whole page as one 3-column CSS grid instead of st.columns rows with one element per card
+    st.markdown(_CONTENT_GRID_TPL.format(cards="".join(cards)), unsafe_allow_html=True)
+
+# One content-table row; rows are joined and emitted under the header in a single st.markdown
+_CONTENT_TABLE_ROW_TPL = (
+    '<div class="table-row">'
+    '<div class="table-cell-title">'
+    '<span class="table-platform-dot" style="background: {color};"></span>'
+    '<span style="font-size: 11px;">{icon}</span>'
+    '<span style="overflow: hidden; text-overflow: ellipsis; white-space: nowrap; font-size: 13px; margin-left: 12px;">{title}</span>'
+    '<span style="font-size: 9px; color: #5A6577; margin-left: 4px;">{content_type}</span>'
+    '</div>'
+    '<div>{views}</div>'
+    '<div>{likes}</div>'
+    '<div>{comments}</div>'
+    '<div>{shares}</div>'
+    '<div>{saves}</div>'
+    '<div class="table-cell-score" style="color: {vs_color};">{vs}%</div>'
+    '<div class="table-cell-score" style="color: {cs_color};">{cs}%</div>'
+    '</div>'
+)
 
 def render_content_table(page_df, current_sort):
     """Render content as a detailed table view."""
@@ -327,49 +354,30 @@ def render_content_table(page_df, current_sort):
         arrow = " ↓" if col["key"] == active_sort_col else ""
         header_cells += f'<div class="table-header-cell{active_class}">{col["label"]}{arrow}</div>'
 
-    st.markdown(f'<div class="table-header">{header_cells}</div>', unsafe_allow_html=True)
-
     # Build table rows
-    for _, post in page_df.iterrows():
-        platform = post['platform']
-        color = PLATFORM_COLORS.get(platform, "#FFFFFF")
-        icon = PLATFORM_ICONS.get(platform, "📄")
+    rows = df_records(page_df, ['platform', 'title', 'content_type', 'virality_score', 'conversion_score'])
+    # Count columns are formatted column-at-a-time rather than per cell
+    counts = [format_number_array(page_df[col].to_numpy()) for col in ('views', 'likes', 'comments', 'shares', 'saves')]
+    row_html = []
+    for (platform, title, content_type, vs, cs), views, likes, comments, shares, saves in zip(rows, *counts):
+        color, icon = PLATFORM_META.get(platform, _UNKNOWN_PLATFORM)
         
         # Virality score color
         # Green >=3.0, Yellow >=1.5, Red <1.5
-        vs = post['virality_score']
         vs_color = NEON_GREEN if vs >= 3.0 else (NEON_YELLOW if vs >= 1.5 else TEXT_PRIMARY)
 
         # Conversion score color
         # Green >=3.0, Yellow >=1.5, Red <1.5
-        cs = post['conversion_score']
         cs_color = NEON_GREEN if cs >= 3.0 else (NEON_YELLOW if cs >= 1.5 else TEXT_PRIMARY)
 
-        st.markdown(f"""
-        <div class="table-row">
-            <div class="table-cell-title">
-                <span class="table-platform-dot" style="background: {color};"></span>
-                <span style="font-size: 11px;">{icon}</span>
-                <span style="overflow: hidden; text-overflow: ellipsis; white-space: nowrap; font-size: 13px; margin-left: 12px;">
-                    {post['title']}
-                </span>
-                <span style="font-size: 9px; color: #5A6577; margin-left: 4px;">
-                    {post['content_type']}
-                </span>
-            </div>
-            <div>{format_number(post['views'])}</div>
-            <div>{format_number(post['likes'])}</div>
-            <div>{format_number(post['comments'])}</div>
-            <div>{format_number(post['shares'])}</div>
-            <div>{format_number(post['saves'])}</div>
-            <div class="table-cell-score" style="color: {vs_color};">
-                {post['virality_score']}%
-            </div>
-            <div class="table-cell-score" style="color: {cs_color};">
-                {post['conversion_score']}%
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        row_html.append(_CONTENT_TABLE_ROW_TPL.format(
+            color=color, icon=icon, title=title, content_type=content_type,
+            views=views, likes=likes, comments=comments, shares=shares, saves=saves,
+            vs=vs, vs_color=vs_color, cs=cs, cs_color=cs_color,
+        ))
+
+    # Header and rows go out as one element, so .table-row:last-child rounds the real last row
+    st.markdown(f'<div><div class="table-header">{header_cells}</div>{"".join(row_html)}</div>', unsafe_allow_html=True)
 
 def render_pagination(current_page, total_pages):
     """Render pagination controls"""
@@ -418,6 +426,9 @@ def render_pagination(current_page, total_pages):
         else:
             st.button("Next →", key="page_next_disabled", disabled=True, width='stretch') 
 
+# Columns render_metrics_stacks sums per platform
+_METRIC_STACK_SUM_COLUMNS = ['likes', 'comments', 'shares', 'saves', 'impressions', 'link_clicks', 'profile_visits', 'posts_published']
+
 def render_metrics_stacks(df):
     """
     Section 2: Metric Stack (Depth & Traffic)
@@ -431,24 +442,24 @@ def render_metrics_stacks(df):
 
     st.markdown('<div class="section-header">📊 METRIC STACK — DEPTH & TRAFFIC</div>', unsafe_allow_html=True)
 
-    platforms = df['platform'].unique().tolist()
-
     # --- Agregate metrics by platform ---
-    total_like = df['likes'].sum()
-    total_comments = df['comments'].sum()
-    total_shares = df['shares'].sum()
-    total_saves = df['saves'].sum()
-    total_impressions = df['impressions'].sum()
-    total_link_clicks = df['link_clicks'].sum()
-    total_profile_visits = df['profile_visits'].sum()
-    total_posts = df['posts_published'].sum()
+    # One grouped pass for every per-platform sum; the overall totals are summed from those
+    by_platform = df.groupby('platform', sort=False, observed=True)
+    totals = by_platform[_METRIC_STACK_SUM_COLUMNS].sum()
+    p_days = by_platform['date'].nunique()
+    p_goal_weekly = by_platform['posts_goal_weekly'].first()
+
+    total_like = totals['likes'].sum()
+    total_comments = totals['comments'].sum()
+    total_shares = totals['shares'].sum()
+    total_saves = totals['saves'].sum()
+    total_impressions = totals['impressions'].sum()
+    total_link_clicks = totals['link_clicks'].sum()
+    total_profile_visits = totals['profile_visits'].sum()
+    total_posts = totals['posts_published'].sum()
     total_days = df['date'].nunique()
 
-    total_posts_goal = sum([
-        df[df['platform'] == p]['posts_goal_weekly'].iloc[0] / 7 * total_days
-        for p in platforms
-        if len(df[df['platform'] == p]) > 0
-    ])
+    total_posts_goal = (p_goal_weekly / 7 * total_days).sum()
 
     # enggagement rate
     agg_er = (total_like + total_comments + total_shares) / total_impressions * 100 if total_impressions > 0 else 0
@@ -470,47 +481,40 @@ def render_metrics_stacks(df):
         "cs": 80.0
     }
 
+    # --- Per-platform rates, one vectorized divide per metric (0 where the denominator is 0) ---
+    p_impressions = totals['impressions']
+    p_engagement = totals[['likes', 'comments', 'shares']].sum(axis=1)
+    p_goal = p_goal_weekly / 7 * p_days
+
+    # engagement rate
+    er = (p_engagement / p_impressions * 100).where(p_impressions > 0, 0)
+    # share of voice
+    sov = ((totals['saves'] + totals['shares']) / p_impressions * 100).where(p_impressions > 0, 0)
+    # profile conversion rate
+    pcr = (totals['link_clicks'] / totals['profile_visits'] * 100).where(totals['profile_visits'] > 0, 0)
+    # consistency score
+    cs = (totals['posts_published'] / p_goal * 100).where(p_goal > 0, 0)
+
+    # Dialy ER trend for sparkline
+    daily = df.groupby(['platform', 'date'], observed=True)[['likes', 'comments', 'shares', 'impressions']].sum()
+    daily_er = (daily['likes'] + daily['comments'] + daily['shares']) / daily['impressions'].clip(lower=1) * 100
+    daily_er = daily_er.groupby(level='platform', observed=True).agg(list)
+
     # --- Render Metric Stacks per platform ---
-    platform_metrics = []
-    for platform in platforms:
-        pdf = df[df['platform'] == platform]
-        p_impressions = pdf['impressions'].sum()
-        p_likes = pdf['likes'].sum()
-        p_comments = pdf['comments'].sum()
-        p_shares = pdf['shares'].sum()
-        p_saves = pdf['saves'].sum()
-        p_link_clicks = pdf['link_clicks'].sum()
-        p_profile_visits = pdf['profile_visits'].sum()
-        p_posts = pdf['posts_published'].sum()
-        p_days = pdf['date'].nunique()
-        p_goal = pdf['posts_goal_weekly'].iloc[0] / 7 * p_days if len(pdf) > 0 else 0
-
-        # engagement rate
-        er = (p_likes + p_comments + p_shares) / p_impressions * 100 if p_impressions > 0 else 0
-        # share of voice
-        sov = (p_saves + p_shares) / p_impressions * 100 if p_impressions > 0 else 0
-        # profile conversion rate
-        pcr = p_link_clicks / p_profile_visits * 100 if p_profile_visits > 0 else 0
-        # consistency score
-        cs = p_posts / p_goal * 100 if p_goal > 0 else 0
-
-        # Dialy ER trend for sparkline
-        dialy_e = pdf.groupby('date').apply(
-            lambda x: (x['likes'].sum() + x['comments'].sum() + x['shares'].sum()) / max(x['impressions'].sum(), 1) * 100,
-            include_groups=False
-        ).tolist()
-
-        platform_metrics.append({
+    platform_metrics = [
+        {
             "platform": platform,
-            "er": er,
-            "sov": sov,
-            "pcr": pcr,
-            "cs": cs,
-            "daily_er": dialy_e,
-            "total_impressions": p_impressions,
-            "total_engagement": p_likes + p_comments + p_shares,
-            "total_traffic": p_link_clicks
-        })
+            "er": er[platform],
+            "sov": sov[platform],
+            "pcr": pcr[platform],
+            "cs": cs[platform],
+            "daily_er": daily_er[platform],
+            "total_impressions": p_impressions[platform],
+            "total_engagement": p_engagement[platform],
+            "total_traffic": totals.at[platform, 'link_clicks']
+        }
+        for platform in totals.index
+    ]
 
     # --- Render Comparison Bar Chart ---
     # _render_metric_comparison_chart(platform_metrics, benchmarks)
@@ -527,8 +531,7 @@ def _render_platform_metric_cards(platform_metrics, benchmarks):
 
     for idx, pm in enumerate(platform_metrics):
         platform = pm["platform"]
-        color = PLATFORM_COLORS[platform]
-        icon = PLATFORM_ICONS[platform]
+        color, icon = PLATFORM_META[platform]
 
         # Determine status for each metric
         def get_status(value, benchmark):
@@ -576,6 +579,40 @@ def _render_platform_metric_cards(platform_metrics, benchmarks):
             </div>
             """, unsafe_allow_html=True)
 
+# Organic columns feeding the Reach → Interaction → Click funnel
+_FUNNEL_STAGE_COLUMNS = ['impressions', 'likes', 'comments', 'shares', 'saves', 'link_clicks']
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _engagement_funnel_aggregates(df):
+    """
+    Reach / interaction / click totals for the engagement funnel, plus per-platform stage counts
+    and rates in order of first appearance. Cached on the filtered frame, so reruns triggered by
+    unrelated widgets (sort, view mode, pagination) skip the reductions.
+    """
+    # Aggregate metrics: one column-wise reduction over the stage columns
+    total_reach, likes, comments, shares, _, total_clicks = (
+        df[_FUNNEL_STAGE_COLUMNS].to_numpy(dtype=np.int64).sum(axis=0).tolist()
+    )
+    total_interaction = likes + comments + shares
+
+    # Per platform: one grouped sum, then interaction (incl. saves) summed across the small P×4 block
+    per_platform = df.groupby("platform", sort=False, observed=True)[_FUNNEL_STAGE_COLUMNS].sum()
+    per_platform_interaction = per_platform[["likes", "comments", "shares", "saves"]].sum(axis=1)
+    platform_funnel_data = [
+        {
+            "platform": platform,
+            "Reach": p_reach,
+            "Interaction": p_interaction,
+            "Clicks": p_clicks,
+            "reach_to_int_pct": p_interaction / max(p_reach, 1) * 100,
+            "int_to_click_pct": p_clicks / max(p_interaction, 1) * 100,
+        }
+        for platform, p_reach, p_interaction, p_clicks in zip(
+            per_platform.index, per_platform["impressions"], per_platform_interaction, per_platform["link_clicks"]
+        )
+    ]
+    return total_reach, total_interaction, total_clicks, platform_funnel_data
+
 def render_engagement_funnel(df):
     """
     Visualization A: The Engagement Funnel
@@ -586,12 +623,7 @@ def render_engagement_funnel(df):
     st.markdown('<div class="section-header">🔄 ENGAGEMENT FUNNEL — REACH → INTERACTION → CLICK</div>', unsafe_allow_html=True)
 
     # calculate funnel stages
-    platforms = df['platform'].unique().tolist()
-
-    # Aggregate metrics by platform
-    total_reach = df['impressions'].sum()
-    total_interaction = (df['likes'].sum() + df['comments'].sum() + df['shares'].sum())
-    total_clicks = df['link_clicks'].sum()
+    total_reach, total_interaction, total_clicks, platform_funnel_data = _engagement_funnel_aggregates(df)
 
     reach_to_interaction = (total_interaction / total_reach * 100) if total_reach > 0 else 0
     interaction_to_click = (total_clicks / total_interaction * 100) if total_interaction > 0 else 0
@@ -671,27 +703,10 @@ def render_engagement_funnel(df):
     
     # --- Conversion Rate Table ---
     # Grouped bar chart comparing funnel stages per platform
-    platform_funnel_data = []
-    for platform in platforms:
-        pdf = df[df["platform"] == platform]
-        p_reach = pdf["impressions"].sum()
-        p_interaction = (pdf["likes"] + pdf["comments"] + pdf["shares"] + pdf["saves"]).sum()
-        p_clicks = pdf["link_clicks"].sum()
-
-        platform_funnel_data.append({
-            "platform": platform,
-            "Reach": p_reach,
-            "Interaction": p_interaction,
-            "Clicks": p_clicks,
-            "reach_to_int_pct": p_interaction / max(p_reach, 1) * 100,
-            "int_to_click_pct": p_clicks / max(p_interaction, 1) * 100,
-        })
-
     rate_cols = st.columns(len(platform_funnel_data))
     for idx, pf in enumerate(platform_funnel_data):
         platform = pf["platform"]
-        color = PLATFORM_COLORS[platform]
-        icon = PLATFORM_ICONS[platform]
+        color, icon = PLATFORM_META[platform]
 
         with rate_cols[idx]:
             st.markdown(f"""
@@ -719,7 +734,7 @@ def render_engagement_funnel(df):
             </div>
             """, unsafe_allow_html=True)
 
-def render_content_leaderboard(platform_filter):
+def render_content_leaderboard(content_df):
     """
     Visualization B: The Content Leaderboard
     Top 3 Posts of the Week with badges:
@@ -730,30 +745,22 @@ def render_content_leaderboard(platform_filter):
     """
     st.markdown('<div class="section-header">🏅 CONTENT LEADERBOARD — TOP PERFORMERS THIS WEEK</div>', unsafe_allow_html=True)
 
-    # Generate content data
-    loader = DataLoader()
-    content_df = loader.load_content_library()
-
-    # Apply platform filter
-    if platform_filter:
-        content_df = content_df[content_df["platform"].isin(platform_filter)]
-
     if content_df.empty:
         st.info("No content available for selected platforms.")
         return
 
     # Filter to last 7 days
-    seven_days_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    # Midnight seven days back, as a Timestamp so the datetime64 column compares without parsing a string
+    seven_days_ago = pd.Timestamp(datetime.now() - timedelta(days=7)).normalize()
     week_df = content_df[content_df["date"] >= seven_days_ago]
 
     # If not enough data in last 7 days, use all data
     if len(week_df) < 3:
         week_df = content_df
 
-    # Find winners
-    most_shared = week_df.loc[week_df["shares"].idxmax()]
-    most_commented = week_df.loc[week_df["comments"].idxmax()]
-    most_clicked = week_df.loc[week_df["link_clicks"].idxmax()]
+    # Find winners (row position of each column's max, from one argmax over the 2D block)
+    winner_pos = week_df[["shares", "comments", "link_clicks"]].to_numpy().argmax(axis=0)
+    most_shared, most_commented, most_clicked = (week_df.iloc[pos] for pos in winner_pos)
 
     winners = [
         {
@@ -796,8 +803,7 @@ def render_content_leaderboard(platform_filter):
     for idx, winner in enumerate(winners):
         post = winner["post"]
         platform = post["platform"]
-        p_color = PLATFORM_COLORS.get(platform, "#444")
-        p_icon = PLATFORM_ICONS.get(platform, "📄")
+        p_color, p_icon = PLATFORM_META.get(platform, ("#444", "📄"))
         accent = winner["accent_color"]
         highlight_label = winner["highlight_metric"].replace("_", " ").title()
 
@@ -1102,23 +1108,22 @@ def show_organic_architecture():
     days_map = {"Last 7 Days": 7, "Last 14 Days": 14, "Last 30 Days": 30}
     days = days_map.get(date_range, 60)
 
-    data_loader = DataLoader()
+    data_loader = get_data_loader()
     organic_df = data_loader.load_organic_data()
+    # Fetched once and platform-filtered once below, then shared by the library and leaderboard sections
     content_df = data_loader.load_content_library()
-    organic_df['date'] = pd.to_datetime(organic_df['date'])
 
     # Filter data based on selections
     cutoff_date = datetime.now() - timedelta(days=days)
     organic_df = organic_df[organic_df['date'] >= cutoff_date]
-    content_df = content_df[content_df['date'] >= cutoff_date]
 
     # --- Divider ---
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
     # --- Section 1.A : Cross-Channel Pulse (all platforms, unfiltered) ---
     render_cross_channel_pulse(organic_df)
 
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
     # filter by platform for subsequent sections
     if platform_filter:
@@ -1126,28 +1131,28 @@ def show_organic_architecture():
         content_df = content_df[content_df['platform'].isin(platform_filter)]
     
     # --- Section 1.B: Content Library (detailed posts data) ---
-    content_library_section(platform_filter)
+    content_library_section(content_df)
 
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
     # --- Section 2: Metric Stacks (key metrics breakdown) ---
     render_metrics_stacks(organic_df)
 
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
     # --- Section 3.A : Engagement Funnel & Leaderboard ---
     render_engagement_funnel(organic_df)
 
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
     # --- Section 3.B : Content Leaderboard (top posts with badges) ---
-    render_content_leaderboard(platform_filter)
+    render_content_leaderboard(content_df)
 
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
     # --- Section 4: AI Brain ---
     render_ai_brain(organic_df, platform_filter)
     
-    st.markdown('<div style="height: 1px; background: linear-gradient(to right, transparent, #2D3348, transparent); margin: 24px 0;"></div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_DIVIDER_HTML, unsafe_allow_html=True)
 
 # ============================================================
 # 4. STANDALONE TEST MODE
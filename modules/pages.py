@@ -0,0 +1,35 @@
+"""
+Page handlers for the app.py sidebar navigation.
+Kept out of app.py because Streamlit re-executes the main script in a fresh namespace on
+every rerun; caches defined here live for the whole server process.
+"""
+
+import functools
+
+# Page modules are imported lazily on first visit, then the handler is reused
+@functools.cache
+def _revenue_module():
+    from modules.revenue_engineering import show_revenue_engineering
+    return show_revenue_engineering
+
+@functools.cache
+def _organic_module():
+    from modules.organic_architecture import show_organic_architecture
+    return show_organic_architecture
+
+@functools.cache
+def _cro_module():
+    from modules.cro_terminal import show_cro_terminal
+    return show_cro_terminal
+
+def show_revenue_engineering():
+    """Module 1: Revenue Engineering"""
+    _revenue_module()()
+
+def show_organic_architecture():
+    """Module 2: Organic Architecture"""
+    _organic_module()()
+
+def show_cro_terminal():
+    """Module 3: CRO Terminal"""
+    _cro_module()()
@@ -10,7 +10,7 @@ import plotly.express as px
 from datetime import timedelta
 
 from config.settings import COLORS, FUNNEL_STAGES, TARGETS
-from utils.data_loader import DataLoader
+from utils.data_loader import get_data_loader
 
 def show_revenue_engineering():
     """Main function - Module 1"""
@@ -20,7 +20,7 @@ def show_revenue_engineering():
     st.markdown("---")
 
     # Load Data
-    loader = DataLoader()
+    loader = get_data_loader()
     df = loader.load_revenue_data()
 
     if df.empty:
@@ -320,7 +320,7 @@ def show_welth_engine(df):
     st.markdown("#### 💎 **WEALTH ENGINE — COHORT LTV ANALYSIS**")
 
     # Load cohort data
-    loader = DataLoader()
+    loader = get_data_loader()
     cohort_df = loader.load_cohort_data()
 
     if cohort_df.empty:
@@ -4,153 +4,177 @@ Centralized data loading for all module
 """
 
 import pandas as pd
+import numpy as np
 import streamlit as st
 from pathlib import Path
 
+# Processed files only change when the generators are re-run, so one hour is plenty
+CACHE_TTL = 3600
+
+def df_records(df, cols):
+    """
+    Rows of `df` restricted to `cols`, as plain tuples in column order.
+    Card/table render loops should iterate these instead of df.iterrows(), which builds a Series per row.
+    """
+    return list(zip(*(df[col].to_numpy() for col in cols)))
+
 class DataLoader:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / 'data' / 'processed'
+
+    def _read(self, name, date_col='date', sort_by_date=False, categorical_cols=()):
+        """
+        Read a processed dataset, preferring the Parquet copy written by the generators over CSV.
+        Parquet already stores dates as datetime64, so only CSV (string) dates get parsed.
+        With `sort_by_date`, rows come back in stable date order so callers can slice
+        date windows with searchsorted instead of boolean masks.
+        `categorical_cols` are low-cardinality label columns stored as category dtype, so filters
+        and groupbys on them compare integer codes instead of hashing strings per row.
+        """
+        parquet_path = self.data_dir / f'{name}.parquet'
+        if parquet_path.exists():
+            df = pd.read_parquet(parquet_path)
+        else:
+            df = pd.read_csv(self.data_dir / f'{name}.csv')
+        if date_col and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            df[date_col] = pd.to_datetime(df[date_col])
+        for col in categorical_cols:
+            df[col] = df[col].astype('category')
+        if sort_by_date:
+            df = df.sort_values(date_col, kind='stable', ignore_index=True)
+        return df
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_revenue_data(_self):
         """Load processed revenue data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'revenue_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('revenue_data', sort_by_date=True)
         except FileNotFoundError:
             st.error("Revenue data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
+    def load_north_star_kpis(_self, days=7):
+        """
+        North Star totals for the last `days` days of revenue data.
+        Cached as a small dict so the overview doesn't copy the full revenue frame out of the cache on every rerun.
+        """
+        df = _self.load_revenue_data()
+        if df.empty:
+            return {}
+
+        # Rows are sorted by date, so the window is a tail slice
+        dates = df['date'].to_numpy()
+        window = df.iloc[np.searchsorted(dates, dates[-1] - np.timedelta64(days, 'D'), side='left'):]
+
+        total_revenue = float(window['revenue'].to_numpy().sum())
+        total_spend = float(window['spend'].to_numpy().sum())
+        return {
+            'revenue': total_revenue,
+            'spend': total_spend,
+            'mer': total_revenue / total_spend if total_spend > 0 else 0,
+            'contribution': total_revenue - total_spend,
+        }
+
+    @st.cache_data(ttl=CACHE_TTL)
     def load_cohort_data(_self):
         """Load processed cohort analysis data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'cohort_data.csv')
+            df = _self._read('cohort_data', date_col=None)
             df['aquisition_date'] = pd.to_datetime(df['acquisition_date'])
             return df
         except FileNotFoundError:
             st.error("Cohort data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_social_data(_self):
         """Load processed social media data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'social_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('social_data')
         except FileNotFoundError:
             st.error("Social media data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_funnel_data(_self):
         """Load processed funnel data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'funnel_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('funnel_data')
         except FileNotFoundError:
             st.error("Funnel data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_revops_data(_self):
         """Load processed RevOps automation data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'revops_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('revops_data')
         except FileNotFoundError:
             st.error("RevOps data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_organic_data(_self):
         """Load processed organic architecture data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'organic_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('organic_data', categorical_cols=('platform',))
         except FileNotFoundError:
             st.error("Organic data file not found.")
             return pd.DataFrame()
     
-    @st.cache_data
-    def load_social_data(_self):
-        """Load processed social media data"""
-        try:
-            df = pd.read_csv(_self.data_dir / 'social_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
-        except FileNotFoundError:
-            st.error("Social media data file not found.")
-            return pd.DataFrame()
-    
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_content_library(_self):
         """Load processed content library data"""
         try:
-            df = pd.read_csv(_self.data_dir / 'content_library.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('content_library', categorical_cols=('platform', 'content_type'))
         except FileNotFoundError:
             st.error("Content library data file not found.")
             return pd.DataFrame()
     
     # Module 3 specific data loading functions
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_funnel_module3_data(_self):
         """Load processed funnel data for CRO Terminal"""
         try:
-            df = pd.read_csv(_self.data_dir / 'funnel_module3_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('funnel_module3_data', sort_by_date=True)
         except FileNotFoundError:
             st.error("Funnel data for CRO Terminal not found.")
             return pd.DataFrame()
 
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_funnel_by_device(_self):
         """Load funnel by device data for CRO Terminal"""
         try:
-            df = pd.read_csv(_self.data_dir / 'funnel_by_device.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            # Stable date order also keeps devices in their per-day order
+            return _self._read('funnel_by_device', sort_by_date=True)
         except FileNotFoundError:
             st.error("Funnel by device data for CRO Terminal not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_funnel_by_source(_self):
         """Load funnel by source data for CRO Terminal"""
         try:
-            df = pd.read_csv(_self.data_dir / 'funnel_by_source.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('funnel_by_source', sort_by_date=True)
         except FileNotFoundError:
             st.error("Funnel by source data for CRO Terminal not found.")
             return pd.DataFrame()
     
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_page_speed_data(_self):
         """Load page speed data for CRO Terminal"""
         try:
-            df = pd.read_csv(_self.data_dir / 'page_speed_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('page_speed_data', sort_by_date=True)
         except FileNotFoundError:
             st.error("Page speed data for CRO Terminal not found.")
             return pd.DataFrame()
 
-    @st.cache_data
+    @st.cache_data(ttl=CACHE_TTL)
     def load_traffic_data(_self):
         """Load traffic data for CRO Terminal"""
         try:
-            df = pd.read_csv(_self.data_dir / 'traffic_data.csv')
-            df['date'] = pd.to_datetime(df['date'])
-            return df
+            return _self._read('traffic_data', sort_by_date=True)
         except FileNotFoundError:
             st.error("Traffic data for CRO Terminal not found.")
             return pd.DataFrame()
@@ -164,4 +188,13 @@ class DataLoader:
     #         'social_data': _self.load_social_data(),
     #         'funnel_data': _self.load_funnel_data(),
     #         'revops_data': _self.load_revops_data()
-    #     }
\ No newline at end of file
+    #     }
+
+
+@st.cache_resource
+def get_data_loader():
+    """
+    The DataLoader shared by every page, created once per server process.
+    Its load_* methods are st.cache_data-cached, so the instance only carries the data directory.
+    """
+    return DataLoader()
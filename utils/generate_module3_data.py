@@ -1,15 +1,22 @@
-import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
-import random
+from pathlib import Path
 
 # ============================================================
 # 2. DUMMY DATA GENERATORS
 # ============================================================
 
+def _compact_dtypes(df):
+    """
+    Downcast counts to int32 and rates/amounts to float32.
+    Halves the memory of cached frames and shrinks the Arrow payload sent to the browser.
+    """
+    dtypes = {col: np.int32 for col in df.select_dtypes("integer").columns}
+    dtypes.update({col: np.float32 for col in df.select_dtypes("floating").columns})
+    return df.astype(dtypes)
+
+
 def generate_traffic_data(days=30):
     """
     Generate daily website traffic data simulating Shopify + GA4 + Cloudflare.
@@ -21,93 +28,86 @@ def generate_traffic_data(days=30):
     - Breakdown by device (Mobile, Desktop, Tablet)
     - Breakdown by source (Google Ads, Meta Ads, TikTok Ads, Organic, Direct, Email, Social)
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     dates = pd.date_range(start=start_date, end=end_date, freq='D')
+    n = len(dates)
+
+    # Base traffic with day-of-week patterns
+    is_weekend = dates.dayofweek.to_numpy() >= 5
+
+    # Total raw sessions (including bots)
+    base_sessions = rng.integers(3500, 6500, size=n)
+    base_sessions = np.where(is_weekend, (base_sessions * 1.25).astype(np.int64), base_sessions)  # Weekend boost
+
+    # Bot traffic: 15-30% of total (realistic for e-commerce)
+    bot_pct = rng.uniform(0.15, 0.30, size=n)
+    bot_sessions = (base_sessions * bot_pct).astype(np.int64)
+    human_sessions = base_sessions - bot_sessions
+
+    # Bot breakdown
+    bot_sub_1s = (bot_sessions * rng.uniform(0.40, 0.60, size=n)).astype(np.int64)  # Sessions < 1 second
+    bot_known_ips = (bot_sessions * rng.uniform(0.20, 0.35, size=n)).astype(np.int64)  # Known bot IPs
+    bot_no_js = bot_sessions - bot_sub_1s - bot_known_ips  # No JavaScript execution
+
+    # Device breakdown (human sessions only)
+    mobile_pct = rng.uniform(0.62, 0.72, size=n)  # Mobile dominant (Shopify typical)
+    desktop_pct = rng.uniform(0.22, 0.30, size=n)
+
+    mobile_sessions = (human_sessions * mobile_pct).astype(np.int64)
+    desktop_sessions = (human_sessions * desktop_pct).astype(np.int64)
+    tablet_sessions = human_sessions - mobile_sessions - desktop_sessions
+
+    # Source breakdown (human sessions only)
+    source_names = ["Google Ads", "Meta Ads", "TikTok Ads", "Organic Search", "Direct", "Email"]
+    source_low = np.array([0.20, 0.18, 0.08, 0.12, 0.10, 0.05])
+    source_high = np.array([0.28, 0.25, 0.15, 0.18, 0.15, 0.10])
+    source_pcts = rng.uniform(source_low, source_high, size=(n, len(source_names)))
+
+    # Normalize + remainder = Social Organic
+    source_pcts = source_pcts / source_pcts.sum(axis=1, keepdims=True) * 0.92
+    source_sessions = (human_sessions[:, None] * source_pcts).astype(np.int64)
+    social_organic_sessions = human_sessions - source_sessions.sum(axis=1)
+
+    # Page load time (LCP) — Mobile slower than Desktop
+    lcp_mobile = rng.uniform(2.0, 4.5, size=n)
+    lcp_desktop = rng.uniform(1.2, 2.8, size=n)
+
+    # Occasional speed spikes (simulates issues)
+    speed_spike = rng.random(n) < 0.08
+    lcp_mobile = np.where(speed_spike, rng.uniform(4.0, 6.5, size=n), lcp_mobile)
+
+    data = {
+        "date": dates,
+        "total_sessions": base_sessions,
+        "bot_sessions": bot_sessions,
+        "human_sessions": human_sessions,
+        "bot_sub_1s": bot_sub_1s,
+        "bot_known_ips": bot_known_ips,
+        "bot_no_js": bot_no_js,
+        "bot_pct": (bot_pct * 100).round(1),
+        "mobile_sessions": mobile_sessions,
+        "desktop_sessions": desktop_sessions,
+        "tablet_sessions": tablet_sessions,
+        "lcp_mobile": lcp_mobile.round(1),
+        "lcp_desktop": lcp_desktop.round(1),
+    }
+    for idx, src in enumerate(source_names):
+        data[f"src_{src.lower().replace(' ', '_')}"] = source_sessions[:, idx]
+    data["src_social_organic"] = social_organic_sessions
+
+    return _compact_dtypes(pd.DataFrame(data))
+
+
+def _safe_pct(numerator, denominator):
+    """Element-wise numerator / denominator * 100, with 0 wherever the denominator is 0."""
+    out = np.zeros(np.shape(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out * 100
 
-    all_data = []
-
-    for date in dates:
-        # Base traffic with day-of-week patterns
-        weekday = date.weekday()
-        is_weekend = weekday >= 5
-
-        # Total raw sessions (including bots)
-        base_sessions = np.random.randint(3500, 6500)
-        if is_weekend:
-            base_sessions = int(base_sessions * 1.25)  # Weekend boost
-
-        # Bot traffic: 15-30% of total (realistic for e-commerce)
-        bot_pct = np.random.uniform(0.15, 0.30)
-        bot_sessions = int(base_sessions * bot_pct)
-        human_sessions = base_sessions - bot_sessions
-
-        # Bot breakdown
-        bot_sub_1s = int(bot_sessions * np.random.uniform(0.40, 0.60))  # Sessions < 1 second
-        bot_known_ips = int(bot_sessions * np.random.uniform(0.20, 0.35))  # Known bot IPs
-        bot_no_js = bot_sessions - bot_sub_1s - bot_known_ips  # No JavaScript execution
-
-        # Device breakdown (human sessions only)
-        mobile_pct = np.random.uniform(0.62, 0.72)  # Mobile dominant (Shopify typical)
-        desktop_pct = np.random.uniform(0.22, 0.30)
-        tablet_pct = 1.0 - mobile_pct - desktop_pct
-
-        mobile_sessions = int(human_sessions * mobile_pct)
-        desktop_sessions = int(human_sessions * desktop_pct)
-        tablet_sessions = human_sessions - mobile_sessions - desktop_sessions
-
-        # Source breakdown (human sessions only)
-        source_pcts = {
-            "Google Ads": np.random.uniform(0.20, 0.28),
-            "Meta Ads": np.random.uniform(0.18, 0.25),
-            "TikTok Ads": np.random.uniform(0.08, 0.15),
-            "Organic Search": np.random.uniform(0.12, 0.18),
-            "Direct": np.random.uniform(0.10, 0.15),
-            "Email": np.random.uniform(0.05, 0.10),
-        }
-        # Normalize + remainder = Social Organic
-        total_pct = sum(source_pcts.values())
-        source_pcts = {k: v / total_pct * 0.92 for k, v in source_pcts.items()}
-        source_pcts["Social Organic"] = 1.0 - sum(source_pcts.values())
-
-        source_sessions = {}
-        remaining = human_sessions
-        for src, pct in list(source_pcts.items())[:-1]:
-            s = int(human_sessions * pct)
-            source_sessions[src] = s
-            remaining -= s
-        source_sessions["Social Organic"] = remaining
-
-        # Page load time (LCP) — Mobile slower than Desktop
-        lcp_mobile = round(np.random.uniform(2.0, 4.5), 1)
-        lcp_desktop = round(np.random.uniform(1.2, 2.8), 1)
-
-        # Occasional speed spikes (simulates issues)
-        if np.random.random() < 0.08:
-            lcp_mobile = round(np.random.uniform(4.0, 6.5), 1)
-
-        all_data.append({
-            "date": date,
-            "total_sessions": base_sessions,
-            "bot_sessions": bot_sessions,
-            "human_sessions": human_sessions,
-            "bot_sub_1s": bot_sub_1s,
-            "bot_known_ips": bot_known_ips,
-            "bot_no_js": bot_no_js,
-            "bot_pct": round(bot_pct * 100, 1),
-            "mobile_sessions": mobile_sessions,
-            "desktop_sessions": desktop_sessions,
-            "tablet_sessions": tablet_sessions,
-            "lcp_mobile": lcp_mobile,
-            "lcp_desktop": lcp_desktop,
-            **{f"src_{k.lower().replace(' ', '_')}": v for k, v in source_sessions.items()},
-        })
-
-    return pd.DataFrame(all_data)
-
-
-def generate_funnel_data(days=30):
+
+def generate_funnel_data(days=30, traffic_df=None):
     """
     Generate Shopify conversion funnel data (daily).
     
@@ -119,64 +119,81 @@ def generate_funnel_data(days=30):
     5. Purchase (completed order)
     
     Also generates per-device and per-source funnel breakdowns.
+    Pass `traffic_df` to build on an already generated traffic frame.
     """
-    np.random.seed(42)
-    traffic_df = generate_traffic_data(days=days)
+    rng = np.random.default_rng(42)
+    if traffic_df is None:
+        traffic_df = generate_traffic_data(days=days)
+    n = len(traffic_df)
+    human_sessions = traffic_df["human_sessions"].to_numpy(dtype=np.int32)
+
+    # --- Overall Funnel (realistic Shopify drop-offs) ---
+    landing_page = human_sessions
+    product_page = (landing_page * rng.uniform(0.55, 0.70, size=n)).astype(np.int32)
+    add_to_cart = (product_page * rng.uniform(0.25, 0.40, size=n)).astype(np.int32)
+    checkout = (add_to_cart * rng.uniform(0.50, 0.70, size=n)).astype(np.int32)
+    purchase = (checkout * rng.uniform(0.45, 0.65, size=n)).astype(np.int32)
+
+    # Bounce rate
+    single_page_sessions = landing_page - product_page
+    bounce_rate = _safe_pct(single_page_sessions, landing_page)
+
+    # Cart abandonment
+    cart_abandonment = _safe_pct(add_to_cart - purchase, add_to_cart)
+
+    # True CVR
+    true_cvr = _safe_pct(purchase, human_sessions)
+
+    # AOV (Average Order Value)
+    aov = rng.uniform(45, 95, size=n).round(2)
+    revenue = (purchase * aov).round(2)
+
+    return _compact_dtypes(pd.DataFrame({
+        "date": traffic_df["date"].to_numpy(),
+        "landing_page": landing_page,
+        "product_page": product_page,
+        "add_to_cart": add_to_cart,
+        "checkout": checkout,
+        "purchase": purchase,
+        "bounce_rate": bounce_rate.round(1),
+        "cart_abandonment": cart_abandonment.round(1),
+        "true_cvr": true_cvr.round(2),
+        "aov": aov,
+        "revenue": revenue,
+        "lcp_mobile": traffic_df["lcp_mobile"].to_numpy(),
+        "lcp_desktop": traffic_df["lcp_desktop"].to_numpy(),
+        "human_sessions": human_sessions,
+    }))
+
+
+def _config_ranges(configs, field):
+    """Stack the (low, high) tuples of one config field into two arrays, one entry per config."""
+    ranges = np.array([config[field] for config in configs.values()])
+    return ranges[:, 0], ranges[:, 1]
+
+
+def _expand_breakdown(traffic_df, configs):
+    """
+    Lay out one row per (date, key) pair in date-major order.
+    Returns (dates, keys, sessions) as flat arrays of length len(traffic_df) * len(configs).
+    """
+    n_keys = len(configs)
+    sessions = traffic_df[[config["session_key"] for config in configs.values()]].to_numpy(dtype=np.int32)
+    dates = np.repeat(traffic_df["date"].to_numpy(), n_keys)
+    # Labels are few and repeat every day, so store them as a categorical in config order
+    keys = pd.Categorical.from_codes(np.tile(np.arange(n_keys), len(traffic_df)), categories=list(configs))
+    return dates, keys, sessions.ravel()
 
-    all_data = []
-
-    for _, row in traffic_df.iterrows():
-        date = row["date"]
-        human_sessions = row["human_sessions"]
-
-        # --- Overall Funnel (realistic Shopify drop-offs) ---
-        landing_page = human_sessions
-        product_page = int(landing_page * np.random.uniform(0.55, 0.70))
-        add_to_cart = int(product_page * np.random.uniform(0.25, 0.40))
-        checkout = int(add_to_cart * np.random.uniform(0.50, 0.70))
-        purchase = int(checkout * np.random.uniform(0.45, 0.65))
-
-        # Bounce rate
-        single_page_sessions = landing_page - product_page
-        bounce_rate = single_page_sessions / max(landing_page, 1) * 100
-
-        # Cart abandonment
-        cart_abandonment = (add_to_cart - purchase) / max(add_to_cart, 1) * 100
-
-        # True CVR
-        true_cvr = purchase / max(human_sessions, 1) * 100
-
-        # AOV (Average Order Value)
-        aov = round(np.random.uniform(45, 95), 2)
-        revenue = round(purchase * aov, 2)
-
-        all_data.append({
-            "date": date,
-            "landing_page": landing_page,
-            "product_page": product_page,
-            "add_to_cart": add_to_cart,
-            "checkout": checkout,
-            "purchase": purchase,
-            "bounce_rate": round(bounce_rate, 1),
-            "cart_abandonment": round(cart_abandonment, 1),
-            "true_cvr": round(true_cvr, 2),
-            "aov": aov,
-            "revenue": revenue,
-            "lcp_mobile": row["lcp_mobile"],
-            "lcp_desktop": row["lcp_desktop"],
-            "human_sessions": human_sessions,
-        })
-
-    return pd.DataFrame(all_data)
-
-
-def generate_funnel_by_device(days=30):
+
+def generate_funnel_by_device(days=30, traffic_df=None):
     """
     Generate funnel breakdown per device type (Mobile, Desktop, Tablet).
     Mobile typically has worse CVR but more traffic.
+    Pass `traffic_df` to build on an already generated traffic frame.
     """
-    np.random.seed(43)
-    traffic_df = generate_traffic_data(days=days)
+    rng = np.random.default_rng(43)
+    if traffic_df is None:
+        traffic_df = generate_traffic_data(days=days)
 
     device_configs = {
         "Mobile": {
@@ -205,50 +222,46 @@ def generate_funnel_by_device(days=30):
         },
     }
 
-    all_data = []
-
-    for _, row in traffic_df.iterrows():
-        date = row["date"]
-        for device, config in device_configs.items():
-            sessions = row[config["session_key"]]
-            if sessions <= 0:
-                continue
-
-            landing = sessions
-            product = int(landing * np.random.uniform(*config["product_rate"]))
-            cart = int(product * np.random.uniform(*config["cart_rate"]))
-            checkout = int(cart * np.random.uniform(*config["checkout_rate"]))
-            purchase = int(checkout * np.random.uniform(*config["purchase_rate"]))
-
-            bounce = round(np.random.uniform(*config["bounce_range"]), 1)
-            cart_abandon = round((cart - purchase) / max(cart, 1) * 100, 1)
-            cvr = round(purchase / max(sessions, 1) * 100, 2)
-
-            all_data.append({
-                "date": date,
-                "device": device,
-                "sessions": sessions,
-                "landing_page": landing,
-                "product_page": product,
-                "add_to_cart": cart,
-                "checkout": checkout,
-                "purchase": purchase,
-                "bounce_rate": bounce,
-                "cart_abandonment": cart_abandon,
-                "cvr": cvr,
-            })
-
-    return pd.DataFrame(all_data)
-
-
-def generate_funnel_by_source(days=30):
+    dates, devices, sessions = _expand_breakdown(traffic_df, device_configs)
+    shape = (len(traffic_df), len(device_configs))
+
+    landing = sessions
+    product = (landing * rng.uniform(*_config_ranges(device_configs, "product_rate"), size=shape).ravel()).astype(np.int32)
+    cart = (product * rng.uniform(*_config_ranges(device_configs, "cart_rate"), size=shape).ravel()).astype(np.int32)
+    checkout = (cart * rng.uniform(*_config_ranges(device_configs, "checkout_rate"), size=shape).ravel()).astype(np.int32)
+    purchase = (checkout * rng.uniform(*_config_ranges(device_configs, "purchase_rate"), size=shape).ravel()).astype(np.int32)
+
+    bounce = rng.uniform(*_config_ranges(device_configs, "bounce_range"), size=shape).ravel().round(1)
+    cart_abandon = _safe_pct(cart - purchase, cart).round(1)
+    cvr = _safe_pct(purchase, sessions).round(2)
+
+    df = pd.DataFrame({
+        "date": dates,
+        "device": devices,
+        "sessions": sessions,
+        "landing_page": landing,
+        "product_page": product,
+        "add_to_cart": cart,
+        "checkout": checkout,
+        "purchase": purchase,
+        "bounce_rate": bounce,
+        "cart_abandonment": cart_abandon,
+        "cvr": cvr,
+    })
+
+    return _compact_dtypes(df[df["sessions"] > 0].reset_index(drop=True))
+
+
+def generate_funnel_by_source(days=30, traffic_df=None):
     """
     Generate funnel breakdown per traffic source.
     Paid traffic has higher volume but sometimes lower CVR.
     Organic/Direct tends to have higher CVR (intent-driven).
+    Pass `traffic_df` to build on an already generated traffic frame.
     """
-    np.random.seed(44)
-    traffic_df = generate_traffic_data(days=days)
+    rng = np.random.default_rng(44)
+    if traffic_df is None:
+        traffic_df = generate_traffic_data(days=days)
 
     source_configs = {
         "Google Ads": {
@@ -302,38 +315,32 @@ def generate_funnel_by_source(days=30):
         },
     }
 
-    all_data = []
+    dates, sources, sessions = _expand_breakdown(traffic_df, source_configs)
+    shape = (len(traffic_df), len(source_configs))
 
-    for _, row in traffic_df.iterrows():
-        date = row["date"]
-        for source, config in source_configs.items():
-            sessions = row.get(config["session_key"], 0)
-            if sessions <= 0:
-                continue
+    landing = sessions
+    product = (landing * rng.uniform(*_config_ranges(source_configs, "product_rate"), size=shape).ravel()).astype(np.int32)
+    cart = (product * rng.uniform(*_config_ranges(source_configs, "cart_rate"), size=shape).ravel()).astype(np.int32)
+    checkout = (cart * rng.uniform(*_config_ranges(source_configs, "checkout_rate"), size=shape).ravel()).astype(np.int32)
+    purchase = (checkout * rng.uniform(*_config_ranges(source_configs, "purchase_rate"), size=shape).ravel()).astype(np.int32)
 
-            landing = sessions
-            product = int(landing * np.random.uniform(*config["product_rate"]))
-            cart = int(product * np.random.uniform(*config["cart_rate"]))
-            checkout = int(cart * np.random.uniform(*config["checkout_rate"]))
-            purchase = int(checkout * np.random.uniform(*config["purchase_rate"]))
+    cart_abandon = _safe_pct(cart - purchase, cart).round(1)
+    cvr = _safe_pct(purchase, sessions).round(2)
 
-            cart_abandon = round((cart - purchase) / max(cart, 1) * 100, 1)
-            cvr = round(purchase / max(sessions, 1) * 100, 2)
+    df = pd.DataFrame({
+        "date": dates,
+        "source": sources,
+        "sessions": sessions,
+        "landing_page": landing,
+        "product_page": product,
+        "add_to_cart": cart,
+        "checkout": checkout,
+        "purchase": purchase,
+        "cart_abandonment": cart_abandon,
+        "cvr": cvr,
+    })
 
-            all_data.append({
-                "date": date,
-                "source": source,
-                "sessions": sessions,
-                "landing_page": landing,
-                "product_page": product,
-                "add_to_cart": cart,
-                "checkout": checkout,
-                "purchase": purchase,
-                "cart_abandonment": cart_abandon,
-                "cvr": cvr,
-            })
-
-    return pd.DataFrame(all_data)
+    return _compact_dtypes(df[df["sessions"] > 0].reset_index(drop=True))
 
 
 def generate_page_speed_data(days=30):
@@ -344,52 +351,54 @@ def generate_page_speed_data(days=30):
     - FID (First Input Delay)
     - CLS (Cumulative Layout Shift)
     """
-    np.random.seed(45)
+    rng = np.random.default_rng(45)
     end_date = datetime.now()
     dates = pd.date_range(start=end_date - timedelta(days=days), end=end_date, freq='D')
+    n = len(dates)
+
+    # One draw for every vital: Mobile typically slower, Desktop faster
+    columns = ["lcp_mobile", "lcp_desktop", "fid_mobile", "fid_desktop", "cls_mobile", "cls_desktop"]
+    low = np.array([2.2, 1.0, 80, 30, 0.05, 0.02])
+    high = np.array([4.2, 2.5, 250, 120, 0.25, 0.12])
+    decimals = [1, 1, 0, 0, 2, 2]
+    vitals = rng.uniform(low, high, size=(n, len(columns)))
+
+    # Occasional spikes (app installs, theme changes, etc.)
+    spike = rng.random(n) < 0.07
+    vitals[spike, 0] = rng.uniform(4.5, 7.0, size=spike.sum())
+    vitals[spike, 2] = rng.uniform(300, 500, size=spike.sum())
+
+    data = {"date": dates}
+    for idx, (col, dec) in enumerate(zip(columns, decimals)):
+        data[col] = vitals[:, idx].round(dec)
+
+    return _compact_dtypes(pd.DataFrame(data))
+
+
+def generate_all(days=30, output_dir=None):
+    """
+    Generate every Module 3 dataset and save it as Parquet for the DataLoader.
+    Parquet keeps dtypes (datetime64 dates, int/float columns) and reads much faster than CSV.
+    Traffic is generated once and shared by the funnel, device and source builders.
+    """
+    output_dir = Path(output_dir) if output_dir else Path(__file__).parent.parent / "data" / "processed"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    traffic_df = generate_traffic_data(days=days)
+    datasets = {
+        "traffic_data": traffic_df,
+        "funnel_module3_data": generate_funnel_data(days=days, traffic_df=traffic_df),
+        "funnel_by_device": generate_funnel_by_device(days=days, traffic_df=traffic_df),
+        "funnel_by_source": generate_funnel_by_source(days=days, traffic_df=traffic_df),
+        "page_speed_data": generate_page_speed_data(days=days),
+    }
+
+    for name, df in datasets.items():
+        df.to_parquet(output_dir / f"{name}.parquet", compression="zstd", index=False)
+
+    return datasets
+
 
-    all_data = []
-
-    for date in dates:
-        # Mobile — typically slower
-        lcp_mobile = round(np.random.uniform(2.2, 4.2), 1)
-        fid_mobile = round(np.random.uniform(80, 250), 0)
-        cls_mobile = round(np.random.uniform(0.05, 0.25), 2)
-
-        # Desktop — faster
-        lcp_desktop = round(np.random.uniform(1.0, 2.5), 1)
-        fid_desktop = round(np.random.uniform(30, 120), 0)
-        cls_desktop = round(np.random.uniform(0.02, 0.12), 2)
-
-        # Occasional spikes (app installs, theme changes, etc.)
-        if np.random.random() < 0.07:
-            lcp_mobile = round(np.random.uniform(4.5, 7.0), 1)
-            fid_mobile = round(np.random.uniform(300, 500), 0)
-
-        all_data.append({
-            "date": date,
-            "lcp_mobile": lcp_mobile,
-            "lcp_desktop": lcp_desktop,
-            "fid_mobile": fid_mobile,
-            "fid_desktop": fid_desktop,
-            "cls_mobile": cls_mobile,
-            "cls_desktop": cls_desktop,
-        })
-
-    return pd.DataFrame(all_data)
-
-# # Run this cell to generate and save the data (only needs to be done once)
-# if __name__ == "__main__":
-#     traffic_df = generate_traffic_data()
-#     funnel_df = generate_funnel_data()
-#     funnel_device_df = generate_funnel_by_device()
-#     funnel_source_df = generate_funnel_by_source()
-#     speed_df = generate_page_speed_data()
-
-#     # Save to CSV for loading in the dashboard
-#     path = "../data/module3/"
-#     traffic_df.to_csv(path + "traffic_data.csv", index=False)
-#     funnel_df.to_csv(path + "funnel_data.csv", index=False)
-#     funnel_device_df.to_csv(path + "funnel_by_device.csv", index=False)
-#     funnel_source_df.to_csv(path + "funnel_by_source.csv", index=False)
-#     speed_df.to_csv(path + "page_speed_data.csv", index=False)
+# Run this file to generate and save the data (only needs to be done once)
+if __name__ == "__main__":
+    generate_all()